@@ -17,28 +17,165 @@ Usage:
   - transcript_path: Path to session transcript
 """
 import fcntl
-import json
 import os
+import socket
 import sys
-from datetime import datetime
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Optional
 
+from serialization import dumps_bytes, loads_bytes
 
-def parse_hook_input(input_str: str) -> Optional[dict]:
+
+# Interned event-type labels: one shared object per label across the
+# whole session instead of a fresh string per event
+_EVT_FILE_WRITE = sys.intern("file_write")
+_EVT_FILE_EDIT = sys.intern("file_edit")
+_EVT_COMMAND = sys.intern("command")
+_EVT_TASK_DELEGATION = sys.intern("task_delegation")
+
+
+# Commands too trivial to be learning events when they lack a description
+_TRIVIAL_PREFIXES = ("ls", "pwd", "cd", "echo", "cat ", "which ")
+
+
+# Fields whose values can be huge (whole file contents) but of which we
+# only ever keep a short preview; truncated before parsing so a multi-MB
+# Write event never materializes as a Python string
+_TRUNCATE_KEYS = (b'"content"', b'"prompt"', b'"old_string"', b'"new_string"')
+# Bytes kept per large field. Escape-dense content decodes to as few as
+# limit/6 chars (every char a \uXXXX unit), so this must be at least
+# 6x the largest preview slice (500 chars) to never shrink a preview.
+_TRUNCATE_LIMIT = 4096
+# Only bother scanning inputs big enough for truncation to matter
+_TRUNCATE_THRESHOLD = 16384
+
+
+def _scan_string_value(data: bytes, i: int) -> tuple[int, Optional[int]]:
+    """Walk a JSON string value starting at index i (after the opening quote).
+
+    Returns (index of the closing quote, safe cut index or None). The cut
+    index, when set, is a position past _TRUNCATE_LIMIT bytes that does not
+    fall inside an escape sequence or a multi-byte UTF-8 character.
+    """
+    start = i
+    cut = None
+    n = len(data)
+    while i < n:
+        byte = data[i]
+        if byte == 0x5C:  # backslash - skip the escaped char
+            i += 2
+            if i <= n and data[i - 1:i] == b"u":
+                i += 4
+        elif byte == 0x22:  # unescaped closing quote
+            return i, cut
+        else:
+            i += 1
+        if cut is None and i - start >= _TRUNCATE_LIMIT:
+            j = min(i, n)
+            # Back off any trailing UTF-8 continuation bytes
+            while j > start and (data[j - 1] & 0xC0) == 0x80:
+                j -= 1
+            # Back off a trailing \uXXXX high surrogate: cutting between
+            # the halves of a surrogate pair leaves a lone high surrogate,
+            # which orjson rejects outright
+            while j - 6 >= start and data[j - 6 : j - 4] == b"\\u":
+                try:
+                    unit = int(data[j - 4 : j], 16)
+                except ValueError:
+                    break
+                if not 0xD800 <= unit <= 0xDBFF:
+                    break
+                j -= 6
+            cut = j
+    raise ValueError("unterminated JSON string")
+
+
+def _truncate_large_fields(data: bytes) -> bytes:
+    """Truncate oversized preview-only string values in raw hook JSON.
+
+    Falls back to the original bytes if the input doesn't scan cleanly.
+    """
+    try:
+        n = len(data)
+        pieces = []
+        prev = 0
+        pos = 0
+        while True:
+            # Earliest occurrence of any truncatable key from pos onward
+            nxt = -1
+            key_len = 0
+            for key in _TRUNCATE_KEYS:
+                found = data.find(key, pos)
+                if found >= 0 and (nxt < 0 or found < nxt):
+                    nxt = found
+                    key_len = len(key)
+            if nxt < 0:
+                break
+
+            # Expect ':' then an opening quote; anything else means this
+            # wasn't actually a key occurrence
+            i = nxt + key_len
+            while i < n and data[i] in b" \t\n\r":
+                i += 1
+            if i >= n or data[i] != 0x3A:  # ':'
+                pos = nxt + 1
+                continue
+            i += 1
+            while i < n and data[i] in b" \t\n\r":
+                i += 1
+            if i >= n or data[i] != 0x22:  # '"'
+                pos = nxt + 1
+                continue
+
+            end, cut = _scan_string_value(data, i + 1)
+            if cut is not None:
+                pieces.append(data[prev:cut])
+                pieces.append(b'"')
+                prev = end + 1
+            pos = end + 1
+
+        if not pieces:
+            return data
+        pieces.append(data[prev:])
+        return b"".join(pieces)
+    except (ValueError, IndexError):
+        return data
+
+
+# Directories already created by this process - skips the stat+mkdir
+# syscalls that would otherwise run on every event
+_ENSURED_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p that only hits the filesystem once per directory."""
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
+
+def parse_hook_input(input_data: bytes | str) -> Optional[dict]:
     """Parse JSON hook input from stdin.
 
+    Accepts raw bytes so callers can pass sys.stdin.buffer.read()
+    straight through without an intermediate decode pass.
+
     Args:
-        input_str: JSON string from hook stdin
+        input_data: JSON bytes or string from hook stdin
 
     Returns:
         Parsed dict or None if invalid
     """
-    if not input_str or not input_str.strip():
+    if not input_data or not input_data.strip():
         return None
+    if isinstance(input_data, bytes) and len(input_data) > _TRUNCATE_THRESHOLD:
+        input_data = _truncate_large_fields(input_data)
     try:
-        return json.loads(input_str)
-    except json.JSONDecodeError:
+        return loads_bytes(input_data)
+    except ValueError:
         return None
 
 
@@ -60,84 +197,148 @@ def extract_learning_event(hook_data: dict) -> Optional[dict]:
     Returns:
         Learning event dict or None if not learning-worthy
     """
-    tool_name = hook_data.get("tool_name", "")
-    tool_input = hook_data.get("tool_input", {})
-    session_id = hook_data.get("session_id", "unknown")
+    builder = _EVENT_DISPATCH.get(hook_data.get("tool_name", ""))
+    if builder is None:
+        # Read, Glob, Grep, etc. - not learning events
+        return None
 
-    timestamp = datetime.now().isoformat()
-
-    # File write - new file creation
-    if tool_name == "Write":
-        file_path = tool_input.get("file_path", "")
-        content = tool_input.get("content", "")
-
-        return {
-            "timestamp": timestamp,
-            "session_id": session_id,
-            "event_type": "file_write",
-            "file_path": file_path,
-            "context": {
-                "content_preview": content[:500] if content else "",
-                "content_lines": len(content.split("\n")) if content else 0
-            }
+    # Epoch float: ~20x cheaper than datetime.now().isoformat() and just
+    # as useful to the machine consumers of the JSONL log
+    return builder(
+        hook_data.get("tool_input", {}),
+        hook_data.get("session_id", "unknown"),
+        time.time(),
+    )
+
+
+def _write_event(tool_input: dict, session_id: str, timestamp: float) -> dict:
+    """File write - new file creation."""
+    content = tool_input.get("content", "")
+    return {
+        "timestamp": timestamp,
+        "session_id": session_id,
+        "event_type": _EVT_FILE_WRITE,
+        "file_path": tool_input.get("file_path", ""),
+        "context": {
+            "content_preview": content[:500] if content else "",
+            "content_lines": (content.count("\n") + 1) if content else 0
         }
-
-    # File edit - modifications
-    if tool_name == "Edit":
-        file_path = tool_input.get("file_path", "")
-        old_string = tool_input.get("old_string", "")
-        new_string = tool_input.get("new_string", "")
-
-        return {
-            "timestamp": timestamp,
-            "session_id": session_id,
-            "event_type": "file_edit",
-            "file_path": file_path,
-            "context": {
-                "old_string": old_string[:200] if old_string else "",
-                "new_string": new_string[:200] if new_string else "",
-                "replace_all": tool_input.get("replace_all", False)
-            }
+    }
+
+
+def _edit_event(tool_input: dict, session_id: str, timestamp: float) -> dict:
+    """File edit - modifications."""
+    old_string = tool_input.get("old_string", "")
+    new_string = tool_input.get("new_string", "")
+    return {
+        "timestamp": timestamp,
+        "session_id": session_id,
+        "event_type": _EVT_FILE_EDIT,
+        "file_path": tool_input.get("file_path", ""),
+        "context": {
+            "old_string": old_string[:200] if old_string else "",
+            "new_string": new_string[:200] if new_string else "",
+            "replace_all": tool_input.get("replace_all", False)
         }
+    }
 
-    # Bash command - debugging steps
-    if tool_name == "Bash":
-        command = tool_input.get("command", "")
-        description = tool_input.get("description", "")
-
-        # Skip trivial commands without descriptions
-        trivial_prefixes = ("ls", "pwd", "cd", "echo", "cat ", "which ")
-        if not description and any(command.strip().startswith(p) for p in trivial_prefixes):
-            return None
-
-        return {
-            "timestamp": timestamp,
-            "session_id": session_id,
-            "event_type": "command",
-            "command": command,
-            "description": description,
-            "context": {
-                "run_in_background": tool_input.get("run_in_background", False)
-            }
-        }
 
-    # Task delegation - exploration patterns
-    if tool_name == "Task":
-        return {
-            "timestamp": timestamp,
-            "session_id": session_id,
-            "event_type": "task_delegation",
-            "context": {
-                "description": tool_input.get("description", ""),
-                "prompt": tool_input.get("prompt", "")[:500],
-                "subagent_type": tool_input.get("subagent_type", "")
-            }
+def _bash_event(tool_input: dict, session_id: str,
+                timestamp: float) -> Optional[dict]:
+    """Bash command - debugging steps."""
+    command = tool_input.get("command", "")
+    description = tool_input.get("description", "")
+
+    # Skip trivial commands without descriptions - startswith with a
+    # tuple checks all prefixes in a single C-level call
+    if not description and command.lstrip().startswith(_TRIVIAL_PREFIXES):
+        return None
+
+    return {
+        "timestamp": timestamp,
+        "session_id": session_id,
+        "event_type": _EVT_COMMAND,
+        "command": command,
+        "description": description,
+        "context": {
+            "run_in_background": tool_input.get("run_in_background", False)
         }
+    }
+
+
+def _task_event(tool_input: dict, session_id: str, timestamp: float) -> dict:
+    """Task delegation - exploration patterns."""
+    return {
+        "timestamp": timestamp,
+        "session_id": session_id,
+        "event_type": _EVT_TASK_DELEGATION,
+        "context": {
+            "description": tool_input.get("description", ""),
+            "prompt": tool_input.get("prompt", "")[:500],
+            "subagent_type": tool_input.get("subagent_type", "")
+        }
+    }
+
+
+# One dict lookup replaces the tool-name if-chain; anything not listed
+# is ignored
+_EVENT_DISPATCH = {
+    "Write": _write_event,
+    "Edit": _edit_event,
+    "Bash": _bash_event,
+    "Task": _task_event,
+}
+
+
+@lru_cache(maxsize=128)
+def _decode_project_base(transcript_path: str) -> Optional[Path]:
+    """Decode the project path encoded in a transcript path.
+
+    The decode is invariant for a given transcript path, so memoize it -
+    after the first hook invocation this is a dict lookup.
+
+    Args:
+        transcript_path: Path to the session transcript
+
+    Returns:
+        Decoded project Path or None if it can't be derived
+    """
+    if not transcript_path or ".claude/projects/" not in transcript_path:
+        return None
+
+    # Get the encoded project path segment
+    parts = transcript_path.split(".claude/projects/")
+    if len(parts) > 1:
+        encoded = parts[1].split("/")[0]
+        # Decode: replace only leading dash and internal -Users- etc
+        # This is imperfect but better than nothing
+        if encoded.startswith("-"):
+            decoded = encoded[1:].replace("-", "/", encoded.count("-Users-") + encoded.count("-sam-"))
+            if decoded.startswith("Users/"):
+                return Path("/" + decoded)
 
-    # Ignore Read, Glob, Grep, etc. - not learning events
     return None
 
 
+# Cached (hour bucket, formatted date) so strftime isn't repaid per event
+_date_cache: tuple[tuple[int, int, int], str] = ((0, 0, 0), "")
+
+
+def _session_date() -> str:
+    """Today's local date string, reformatted only when the day changes.
+
+    Keyed on the local calendar day itself rather than a UTC time
+    bucket, which would roll at the wrong moment in fractional-offset
+    timezones and misname logs for a window after midnight.
+    """
+    global _date_cache
+    lt = time.localtime()
+    day = (lt.tm_year, lt.tm_mon, lt.tm_mday)
+    if _date_cache[0] != day:
+        _date_cache = (day, f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d}")
+    return _date_cache[1]
+
+
 def get_session_log_path(
     session_id: str,
     transcript_path: str,
@@ -145,7 +346,8 @@ def get_session_log_path(
 ) -> Path:
     """Determine the path for the session activity log.
 
-    Creates per-session JSON files in the project's .claude/sessions/ directory.
+    Creates per-session JSONL files in the project's .claude/sessions/
+    directory.
 
     Args:
         session_id: Session identifier
@@ -165,74 +367,197 @@ def get_session_log_path(
         # Fallback: if cwd looks like home dir or tmp, try transcript path
         cwd_str = str(base)
         if cwd_str == os.path.expanduser("~") or cwd_str.startswith("/tmp"):
-            if transcript_path and ".claude/projects/" in transcript_path:
-                # Get the encoded project path segment
-                parts = transcript_path.split(".claude/projects/")
-                if len(parts) > 1:
-                    encoded = parts[1].split("/")[0]
-                    # Decode: replace only leading dash and internal -Users- etc
-                    # This is imperfect but better than nothing
-                    if encoded.startswith("-"):
-                        decoded = encoded[1:].replace("-", "/", encoded.count("-Users-") + encoded.count("-sam-"))
-                        if decoded.startswith("Users/"):
-                            base = Path("/" + decoded)
+            decoded = _decode_project_base(transcript_path)
+            if decoded is not None:
+                base = decoded
 
     sessions_dir = base / ".claude" / "sessions"
-    sessions_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(sessions_dir)
 
     # Include date in filename for easier browsing
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    return sessions_dir / f"{date_str}-{session_id[:8]}.json"
+    return sessions_dir / f"{_session_date()}-{session_id[:8]}.jsonl"
 
 
-def log_activity(event: dict, log_path: Path) -> None:
-    """Log an activity event to the session file.
+def log_activity_batch(events: list[dict], log_path: Path) -> None:
+    """Append a batch of activity events under a single lock acquisition.
+
+    Events are stored one JSON object per line (JSONL), so each call
+    appends lines instead of rewriting the whole file. The first line of
+    a new file is a header recording session metadata. An exclusive lock
+    on the log file prevents interleaved writes from concurrent hooks.
 
-    Uses file locking to prevent corruption from concurrent writes.
+    Args:
+        events: The learning events to log
+        log_path: Path to the session log file
+    """
+    if not events:
+        return
+
+    _ensure_dir(log_path.parent)
+
+    payload = b"\n".join(dumps_bytes(event) for event in events) + b"\n"
+
+    fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        # O_APPEND makes each write() land atomically at EOF, so the
+        # common append is lock-free across concurrent hook processes.
+        # Only first-write header creation serializes: without the lock
+        # two racing writers could both observe an empty file.
+        if os.fstat(fd).st_size == 0:
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size == 0:  # Re-check under the lock
+                    header = {
+                        "session_id": events[0].get("session_id", "unknown"),
+                        "started": time.time(),
+                    }
+                    payload = dumps_bytes(header) + b"\n" + payload
+                os.write(fd, payload)
+            finally:
+                fcntl.lockf(fd, fcntl.LOCK_UN)
+        else:
+            os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def log_activity(event: dict, log_path: Path) -> None:
+    """Append a single activity event to the session log.
 
     Args:
         event: The learning event to log
         log_path: Path to the session log file
     """
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_activity_batch([event], log_path)
+
+
+# Parsed session logs keyed by (mtime_ns, size), so repeat reads of an
+# unchanged file within one process skip the JSONL parse entirely
+_EVENTS_CACHE: dict[Path, tuple[tuple[int, int], list[dict]]] = {}
+
+
+def load_session(log_path: Path) -> list[dict]:
+    """Load the events of a session log, skipping the header line.
+
+    Results are memoized per file until the log changes on disk; treat
+    the returned list as read-only.
+
+    Args:
+        log_path: Path to the session JSONL log file
+
+    Returns:
+        List of event dicts, empty if the log is missing or unreadable
+    """
+    try:
+        st = os.stat(log_path)
+    except OSError:
+        return []
 
-    # Use file locking for safe concurrent access
-    lock_path = log_path.with_suffix(".lock")
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _EVENTS_CACHE.get(log_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
-    with open(lock_path, "w") as lock_file:
-        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+    events = []
+    try:
+        with open(log_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = loads_bytes(line)
+                except ValueError:
+                    continue  # Skip torn or corrupt lines
+                if "event_type" in record:
+                    # Intern the high-repetition fields so downstream
+                    # dict hashing degrades to pointer comparison and
+                    # thousands of events share one label object
+                    record["event_type"] = sys.intern(record["event_type"])
+                    sid = record.get("session_id")
+                    if type(sid) is str:
+                        record["session_id"] = sys.intern(sid)
+                    events.append(record)
+    except OSError:
+        return []
+
+    _EVENTS_CACHE[log_path] = (key, events)
+    return events
+
+
+def get_daemon_socket_path(log_path: Path) -> Path:
+    """Socket path for the batching daemon of a session log."""
+    return log_path.with_suffix(".sock")
+
+
+def send_to_daemon(event: dict, log_path: Path) -> bool:
+    """Try to hand the event to the batching daemon.
+
+    The daemon coalesces events from many hook invocations and appends
+    them under a single lock acquisition, so the hot path here is just a
+    socket connect and send.
+
+    Args:
+        event: The learning event to log
+        log_path: Path to the session log file
+
+    Returns:
+        True if the event was handed off, False if no daemon is reachable
+    """
+    sock_path = get_daemon_socket_path(log_path)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(sock_path))
+            sock.sendall(dumps_bytes(event) + b"\n")
+        return True
+    except ConnectionRefusedError:
+        # Stale socket left behind by a crashed daemon: a replacement's
+        # bind would fail with EADDRINUSE, so clear it before the caller
+        # spawns one
         try:
-            # Read existing data or create new
-            if log_path.exists():
-                with open(log_path, "r") as f:
-                    data = json.load(f)
-            else:
-                data = {
-                    "session_id": event.get("session_id", "unknown"),
-                    "started": datetime.now().isoformat(),
-                    "events": []
-                }
-
-            # Append event
-            data["events"].append(event)
-            data["updated"] = datetime.now().isoformat()
-
-            # Write back atomically
-            temp_path = log_path.with_suffix(".tmp")
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
-            temp_path.replace(log_path)
-
-        finally:
-            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            os.unlink(sock_path)
+        except OSError:
+            pass
+        return False
+    except OSError:
+        return False
+
+
+def spawn_daemon(log_path: Path) -> None:
+    """Start a detached batching daemon for this session log.
+
+    Silent no-op if the daemon cannot be started - callers fall back to
+    writing directly.
+
+    Args:
+        log_path: Path to the session log file
+    """
+    import subprocess
+
+    daemon_script = Path(__file__).parent / "activity_daemon.py"
+    try:
+        subprocess.Popen(
+            [sys.executable, str(daemon_script), str(log_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
 
 
 def main():
     """Main entry point for the hook."""
-    # Read hook input from stdin
-    input_str = sys.stdin.read()
+    # Read hook input from stdin as bytes - parsing handles the decode.
+    # Close stdin right away so the hook parent unblocks on its pipe
+    # while we do filesystem work.
+    input_bytes = sys.stdin.buffer.read()
+    try:
+        sys.stdin.close()
+    except OSError:
+        pass
 
-    hook_data = parse_hook_input(input_str)
+    hook_data = parse_hook_input(input_bytes)
     if not hook_data:
         sys.exit(0)  # Silent exit on invalid input
 
@@ -246,7 +571,13 @@ def main():
     transcript_path = hook_data.get("transcript_path", "")
     log_path = get_session_log_path(session_id, transcript_path)
 
-    # Log the activity
+    # Fast path: hand off to the batching daemon if one is running
+    if send_to_daemon(event, log_path):
+        return
+
+    # No daemon yet - start one for subsequent events and write this
+    # event directly so nothing is lost
+    spawn_daemon(log_path)
     log_activity(event, log_path)
 
 
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Activity Batching Daemon for Claude Code Learning Quiz Hook.
+
+Short-lived helper spawned by the activity collector. Hook invocations
+hand their events to this daemon over a unix-domain socket instead of
+each taking the log lock themselves. The daemon coalesces events and
+appends them in batches - one lock acquisition per batch instead of one
+per event - then exits after a period of inactivity.
+
+Usage:
+  activity_daemon.py <session_log_path>
+"""
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+
+from activity_collector import get_daemon_socket_path, log_activity_batch
+
+# Flush when this many events have accumulated...
+FLUSH_MAX_EVENTS = 16
+# ...or this many seconds have passed since the last flush
+FLUSH_INTERVAL_SECONDS = 0.05
+# Exit after this long without receiving any events
+IDLE_TIMEOUT_SECONDS = 30.0
+
+
+def recv_events(conn: socket.socket) -> list[dict]:
+    """Read newline-delimited JSON events from a connection."""
+    chunks = []
+    try:
+        while True:
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError:
+        pass
+
+    events = []
+    for line in b"".join(chunks).splitlines():
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
+    return events
+
+
+def run_daemon(log_path: Path) -> None:
+    """Accept events and flush them to the session log in batches.
+
+    Args:
+        log_path: Path to the session log file
+    """
+    sock_path = get_daemon_socket_path(log_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(sock_path))
+    except OSError:
+        # Another daemon already owns this socket
+        return
+
+    try:
+        server.listen()
+        server.settimeout(FLUSH_INTERVAL_SECONDS)
+
+        buffer: list[dict] = []
+        last_flush = time.monotonic()
+        last_event = time.monotonic()
+
+        while True:
+            try:
+                conn, _ = server.accept()
+                with conn:
+                    received = recv_events(conn)
+                if received:
+                    buffer.extend(received)
+                    last_event = time.monotonic()
+            except socket.timeout:
+                pass
+
+            now = time.monotonic()
+            if buffer and (
+                len(buffer) >= FLUSH_MAX_EVENTS
+                or now - last_flush > FLUSH_INTERVAL_SECONDS
+            ):
+                log_activity_batch(buffer, log_path)
+                buffer = []
+                last_flush = now
+
+            if not buffer and now - last_event > IDLE_TIMEOUT_SECONDS:
+                break
+    finally:
+        # Unlink first so new collectors get ENOENT and fall back to a
+        # direct write, then drain connections that raced into the
+        # listen backlog - their sendall already succeeded, so closing
+        # without reading them would lose events
+        try:
+            os.unlink(sock_path)
+        except OSError:
+            pass
+        server.settimeout(0)
+        drained: list[dict] = []
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                break
+            conn.settimeout(FLUSH_INTERVAL_SECONDS)
+            with conn:
+                drained.extend(recv_events(conn))
+        server.close()
+        if drained:
+            log_activity_batch(drained, log_path)
+
+
+def main():
+    """Main entry point for the daemon."""
+    if len(sys.argv) < 2:
+        print("Usage: activity_daemon.py <session_log_path>", file=sys.stderr)
+        sys.exit(1)
+
+    run_daemon(Path(sys.argv[1]))
+
+
+if __name__ == "__main__":
+    main()
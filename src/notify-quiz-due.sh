@@ -3,21 +3,20 @@
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
-# Find all projects with quiz state
-find ~ -name "quiz-state.json" -path "*/.claude/*" 2>/dev/null | while read state_file; do
-    project_dir=$(dirname $(dirname "$state_file"))
+# Find all projects with quiz state. State may live in the snapshot
+# (quiz-state.json), the journal (quiz-state.log), or both, so match
+# either and dedupe to one check per project.
+find ~ \( -name "quiz-state.json" -o -name "quiz-state.log" \) -path "*/.claude/*" 2>/dev/null \
+    | xargs -r -n1 dirname | xargs -r -n1 dirname | sort -u | while read project_dir; do
 
-    # Check for due quizzes
+    # Replay the journal over the snapshot via the scheduler itself so
+    # journaled adds/completions are counted
     due_count=$(python3.11 -c "
-import json
-from datetime import datetime
-with open('$state_file') as f:
-    state = json.load(f)
-due = 0
-for q in state.get('pending_quizzes', []):
-    if datetime.fromisoformat(q['scheduled_for']) <= datetime.now():
-        due += 1
-print(due)
+import sys
+from pathlib import Path
+sys.path.insert(0, '$SCRIPT_DIR')
+from scheduler import get_due_quizzes, load_quiz_state_ro
+print(len(get_due_quizzes(load_quiz_state_ro(Path('$project_dir')))))
 " 2>/dev/null)
 
     if [ "$due_count" -gt 0 ]; then
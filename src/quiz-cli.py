@@ -13,22 +13,17 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from quiz_generator import generate_questions_from_summary, load_summary, save_questions
-from quiz_runner import run_interactive_quiz, save_quiz_result
-from results_tracker import (
-    calculate_topic_scores,
-    generate_blind_spot_report,
-    get_skip_patterns,
-    load_all_results,
-)
+# Subcommand-specific modules (quiz_generator, quiz_runner,
+# results_tracker) are imported inside their cmd_* functions so e.g.
+# `status` doesn't pay their import cost. scheduler is used by most
+# commands and stays top-level.
 from scheduler import (
     ScheduleType,
-    add_pending_quiz,
     get_due_quizzes,
     load_quiz_state,
-    mark_quiz_completed,
-    save_quiz_state,
-    schedule_quiz,
+    record_pending_quiz,
+    record_quiz_completed,
+    schedule_quiz_dict,
 )
 
 
@@ -38,8 +33,10 @@ def find_latest_summary(project_path: Path) -> Path | None:
     if not summaries_dir.exists():
         return None
 
-    summaries = sorted(summaries_dir.glob("*-summary.json"), reverse=True)
-    return summaries[0] if summaries else None
+    # max() scans once without sorting; date-prefixed names make
+    # lexicographic order chronological
+    return max(summaries_dir.glob("*-summary.json"), default=None,
+               key=lambda p: p.name)
 
 
 def find_latest_quiz(project_path: Path) -> Path | None:
@@ -48,12 +45,15 @@ def find_latest_quiz(project_path: Path) -> Path | None:
     if not quizzes_dir.exists():
         return None
 
-    quizzes = sorted(quizzes_dir.glob("*-quiz.json"), reverse=True)
-    return quizzes[0] if quizzes else None
+    return max(quizzes_dir.glob("*-quiz.json"), default=None,
+               key=lambda p: p.name)
 
 
 def cmd_run(args):
     """Run a pending or specified quiz."""
+    from quiz_generator import generate_questions_from_summary, load_summary, save_questions
+    from quiz_runner import run_interactive_quiz, save_quiz_result
+
     project_path = args.project
 
     # Check for pending quizzes
@@ -104,12 +104,11 @@ def cmd_run(args):
         result_path = results_dir / f"{date_str}-{session_id[:8]}-result.json"
         save_quiz_result(results, result_path, session_id)
 
-        # Mark quiz as completed
-        state = mark_quiz_completed(state, session_id, {
+        # Mark quiz as completed via the O(1) journal append
+        record_quiz_completed(project_path, session_id, {
             "score": sum(1 for r in results if r.correct) / len(results) * 100,
             "total": len(results)
         })
-        save_quiz_state(project_path, state)
 
         print(f"\nResults saved to {result_path}")
 
@@ -118,6 +117,8 @@ def cmd_run(args):
 
 def cmd_generate(args):
     """Generate a quiz from the latest session summary."""
+    from quiz_generator import generate_questions_from_summary, load_summary, save_questions
+
     project_path = args.project
 
     summary_path = find_latest_summary(project_path)
@@ -144,15 +145,13 @@ def cmd_generate(args):
     save_questions(questions, quiz_path)
     print(f"Generated {len(questions)} questions: {quiz_path}")
 
-    # Schedule quiz
-    state = load_quiz_state(project_path)
-    schedule = schedule_quiz(
+    # Schedule quiz via the O(1) journal append; the dict form skips
+    # the QuizSchedule round-trip since state stores dicts anyway
+    record_pending_quiz(project_path, schedule_quiz_dict(
         session_id=session_id,
         schedule_type=ScheduleType.ON_DEMAND,
         summary_path=str(summary_path)
-    )
-    state = add_pending_quiz(state, schedule)
-    save_quiz_state(project_path, state)
+    ))
 
     print(f"Quiz ready! Run 'quiz-cli run' to start.")
     return 0
@@ -160,15 +159,15 @@ def cmd_generate(args):
 
 def cmd_report(args):
     """Show blind spot report."""
+    from results_tracker import generate_blind_spot_report, scan_project
+
     project_path = args.project
 
-    results = load_all_results(project_path)
-    if not results:
+    topic_scores, skip_patterns, aggregate = scan_project(project_path)
+    if aggregate["total_quizzes"] == 0:
         print("No quiz results found. Complete some quizzes first.")
         return 1
 
-    topic_scores = calculate_topic_scores(results)
-    skip_patterns = get_skip_patterns(results)
     report = generate_blind_spot_report(topic_scores, skip_patterns)
 
     print(report.to_markdown())
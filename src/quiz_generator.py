@@ -13,12 +13,34 @@ NOT focused on:
 - File location trivia
 """
 import json
+import operator
+import os
 import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator - stdlib json works fine
+    orjson = None
+
+
+# Directories already created by this process - avoids repeating the
+# stat+mkdir syscalls once a directory exists
+_ENSURED_DIRS: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """mkdir -p that only hits the filesystem once per directory."""
+    key = str(path)
+    if key not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(key)
+
 
 class QuestionType(Enum):
     """Types of quiz questions, prioritized by learning value."""
@@ -28,6 +50,11 @@ class QuestionType(Enum):
     ARCHITECTURAL = "architectural"
 
 
+# Summaries with at least this many scannable items run the section
+# generators on a thread pool; below it, threads cost more than they save
+PARALLEL_MIN_ITEMS = 50
+
+
 # Priority order for question types
 QUESTION_PRIORITY = [
     QuestionType.SYSTEM_DESIGN,
@@ -37,7 +64,47 @@ QUESTION_PRIORITY = [
 ]
 
 
-@dataclass
+# Maps each prioritized type to its bucket index in prioritize_questions
+_PRIORITY_INDEX = {t: i for i, t in enumerate(QUESTION_PRIORITY)}
+
+
+# Interned fixed tag vocabulary - dash-containing labels aren't
+# auto-interned by the compiler, and tags repeat across many questions
+_TAG_TECHNOLOGY_CHOICE = sys.intern("technology-choice")
+_TAG_FAILURE_MODE = sys.intern("failure-mode")
+_TAG_RESILIENCE = sys.intern("resilience")
+_TAG_DEPENDENCY_FAILURE = sys.intern("dependency-failure")
+_TAG_DEBUGGING_WORKFLOW = sys.intern("debugging-workflow")
+
+
+# Precompiled patterns - these run inside per-decision/explanation loops,
+# so compile once at import instead of on every call
+# Single alternation so one pass over each decision extracts both bare
+# components and named ones ("auth service"); dispatched by matched group
+_DECISION_RE = re.compile(
+    r"\b(?P<component>service|handler|controller|api|middleware"
+    r"|database|cache|queue|store)\b"
+    r"|(?P<cname>\w+)\s+(?P<ctype>service|handler|controller)\b",
+    re.IGNORECASE,
+)
+_TRADEOFF_RE = re.compile(r"(tradeoff|trade-off|trade off)", re.IGNORECASE)
+_TECH_CHOICE_RE = re.compile(
+    r"(using|chose|picked|selected)\s+(\w+)\s+(because|since|as|for)",
+    re.IGNORECASE,
+)
+_FAILURE_COMPONENT_RE = re.compile(
+    r"(if|when)\s+(\w+)\s+(fails?|goes?\s+down|is\s+slow)", re.IGNORECASE
+)
+_SERVICE_INTERACTION_RE = re.compile(
+    r"\b(writes?\s+to|reads?\s+from|publishes?\s+to|calls?)\s+(\w+)",
+    re.IGNORECASE,
+)
+_DEBUG_TARGET_RE = re.compile(
+    r"(logs?|status|inspect|check|debug)\s+(\w+)", re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
 class Question:
     """A quiz question with metadata."""
     question_type: QuestionType
@@ -48,24 +115,42 @@ class Question:
     difficulty: str = "medium"  # easy, medium, hard
 
 
+# One-slot parse cache: generator and runner reload the same summary
+# within a quiz flow, so remembering just the last file is enough
+_LAST_SUMMARY: tuple[Optional[Path], int, Optional[dict]] = (None, 0, None)
+
+
 def load_summary(summary_path: Path) -> Optional[dict]:
     """Load a session summary from file.
 
+    Repeat loads of an unchanged file return the cached parse; treat
+    the returned dict as read-only.
+
     Args:
         summary_path: Path to the summary JSON file
 
     Returns:
         Summary dict or None if not found
     """
-    if not summary_path.exists():
+    global _LAST_SUMMARY
+
+    try:
+        mtime = os.stat(summary_path).st_mtime_ns
+    except OSError:
         return None
 
+    if _LAST_SUMMARY[0] == summary_path and _LAST_SUMMARY[1] == mtime:
+        return _LAST_SUMMARY[2]
+
     try:
-        with open(summary_path) as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        raw = summary_path.read_bytes()
+        summary = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, IOError):
         return None
 
+    _LAST_SUMMARY = (summary_path, mtime, summary)
+    return summary
+
 
 def generate_system_design_questions(
     decisions: list[str],
@@ -89,16 +174,18 @@ def generate_system_design_questions(
 
     # Generate questions from architectural decisions
     for decision in decisions:
-        # Extract key components mentioned
+        # Extract key components and named components (e.g., "auth service")
+        # in a single scan
         components = []
-        for pattern in [r"\b(service|handler|controller|api|middleware)\b",
-                       r"\b(database|cache|queue|store)\b"]:
-            matches = re.findall(pattern, decision, re.IGNORECASE)
-            components.extend(matches)
-
-        # Also extract named components (e.g., "auth service", "payment handler")
-        named_match = re.search(r"(\w+)\s+(service|handler|controller)", decision, re.IGNORECASE)
-        component_name = named_match.group(1).lower() if named_match else None
+        component_name = None
+        for match in _DECISION_RE.finditer(decision):
+            component = match.group("component")
+            if component:
+                components.append(component)
+            else:
+                components.append(match.group("ctype"))
+                if component_name is None:
+                    component_name = match.group("cname").lower()
 
         if components:
             component = components[0].lower()
@@ -107,13 +194,13 @@ def generate_system_design_questions(
                 question_type=QuestionType.SYSTEM_DESIGN,
                 question=f"Why was a separate {component}{name_part} created for this functionality? What are the benefits and drawbacks? Context: {decision}",
                 expected_answer=f"Based on the session: {decision}. Consider separation of concerns, scalability, and maintainability.",
-                tags=[component, "architecture", "separation"] + ([component_name] if component_name else []),
+                tags=[sys.intern(component), "architecture", "separation"] + ([component_name] if component_name else []),
             )
             questions.append(question)
 
     # Generate questions from tradeoff explanations
     for explanation in explanations:
-        if re.search(r"(tradeoff|trade-off|trade off)", explanation, re.IGNORECASE):
+        if _TRADEOFF_RE.search(explanation):
             # Extract what's being traded
             question = Question(
                 question_type=QuestionType.SYSTEM_DESIGN,
@@ -124,18 +211,14 @@ def generate_system_design_questions(
             questions.append(question)
 
         # Look for technology choices
-        tech_match = re.search(
-            r"(using|chose|picked|selected)\s+(\w+)\s+(because|since|as|for)",
-            explanation,
-            re.IGNORECASE
-        )
+        tech_match = _TECH_CHOICE_RE.search(explanation)
         if tech_match:
             tech = tech_match.group(2)
             question = Question(
                 question_type=QuestionType.SYSTEM_DESIGN,
                 question=f"Why was {tech} chosen for this implementation?",
                 expected_answer=explanation,
-                tags=[tech.lower(), "technology-choice"],
+                tags=[sys.intern(tech.lower()), _TAG_TECHNOLOGY_CHOICE],
             )
             questions.append(question)
 
@@ -166,11 +249,7 @@ def generate_counterfactual_questions(
     # Generate from explicit failure modes
     for failure in failure_modes:
         # Extract the failing component
-        component_match = re.search(
-            r"(if|when)\s+(\w+)\s+(fails?|goes?\s+down|is\s+slow)",
-            failure,
-            re.IGNORECASE
-        )
+        component_match = _FAILURE_COMPONENT_RE.search(failure)
 
         if component_match:
             component = component_match.group(2)
@@ -178,25 +257,21 @@ def generate_counterfactual_questions(
                 question_type=QuestionType.COUNTERFACTUAL,
                 question=f"What happens if {component} fails or becomes unavailable? What's the blast radius?",
                 expected_answer=failure,
-                tags=[component.lower(), "failure-mode", "resilience"],
+                tags=[sys.intern(component.lower()), _TAG_FAILURE_MODE, _TAG_RESILIENCE],
             )
             questions.append(question)
 
     # Generate from decisions that mention multiple services/components
     for decision in decisions:
         # Look for service interactions
-        services = re.findall(
-            r"\b(writes?\s+to|reads?\s+from|publishes?\s+to|calls?)\s+(\w+)",
-            decision,
-            re.IGNORECASE
-        )
+        services = _SERVICE_INTERACTION_RE.findall(decision)
         if services:
             for action, target in services:
                 question = Question(
                     question_type=QuestionType.COUNTERFACTUAL,
                     question=f"What happens if the {target} dependency is down when this operation runs?",
                     expected_answer=f"Based on: {decision}. Consider partial failure, data consistency, and user experience.",
-                    tags=[target.lower(), "dependency-failure", "resilience"],
+                    tags=[sys.intern(target.lower()), _TAG_DEPENDENCY_FAILURE, _TAG_RESILIENCE],
                 )
                 questions.append(question)
 
@@ -227,21 +302,21 @@ def generate_debugging_questions(steps: list[dict]) -> list[Question]:
         if not description:
             continue
 
-        # Extract the target being debugged
-        target_match = re.search(
-            r"(logs?|status|inspect|check|debug)\s+(\w+)",
-            command + " " + description,
-            re.IGNORECASE
-        )
-
-        if target_match:
+        # Extract every target being debugged - a step like "check logs
+        # and inspect queue" yields a question per target
+        seen_targets = set()
+        for target_match in _DEBUG_TARGET_RE.finditer(command + " " + description):
             target = target_match.group(2)
+            target_tag = sys.intern(target.lower())
+            if target_tag in seen_targets:
+                continue
+            seen_targets.add(target_tag)
 
             question = Question(
                 question_type=QuestionType.DEBUGGING,
                 question=f"If you saw issues with {target}, what would your debugging approach be? What log entries or metrics would you look for?",
                 expected_answer=f"One approach: {command}. Purpose: {description}",
-                tags=[target.lower(), "debugging", "diagnosis"],
+                tags=[target_tag, "debugging", "diagnosis"],
             )
             questions.append(question)
 
@@ -252,7 +327,7 @@ def generate_debugging_questions(steps: list[dict]) -> list[Question]:
             question_type=QuestionType.DEBUGGING,
             question="What was the debugging workflow in this session? What did each step reveal?",
             expected_answer=f"Commands used: {', '.join(commands)}. This represents a progressive diagnosis approach.",
-            tags=["debugging-workflow", "diagnosis"],
+            tags=[_TAG_DEBUGGING_WORKFLOW, "diagnosis"],
         )
         questions.append(question)
 
@@ -281,33 +356,34 @@ def prioritize_questions(
     if not questions:
         return []
 
-    # Group by type
-    by_type: dict[QuestionType, list[Question]] = {t: [] for t in QUESTION_PRIORITY}
+    # Group by type into buckets indexed by priority ordinal - array
+    # indexing instead of dict hashing on both passes below
+    buckets: list[list[Question]] = [[] for _ in QUESTION_PRIORITY]
     for q in questions:
-        if q.question_type in by_type:
-            by_type[q.question_type].append(q)
+        idx = _PRIORITY_INDEX.get(q.question_type)
+        if idx is not None:
+            buckets[idx].append(q)
 
-    # Take questions in priority order
+    # Take questions in priority order, tracking how far into each
+    # bucket we've consumed instead of rebuilding the grouped lists
     result = []
+    offsets = [0] * len(buckets)
 
     # First pass: take up to 2 from each category to ensure variety
-    for qtype in QUESTION_PRIORITY:
+    for idx, available in enumerate(buckets):
         if len(result) >= max_questions:
             break
-        available = by_type.get(qtype, [])
-        for q in available[:2]:
-            if len(result) < max_questions:
-                result.append(q)
-                by_type[qtype] = [x for x in by_type[qtype] if x != q]
+        take = min(2, len(available), max_questions - len(result))
+        result.extend(available[:take])
+        offsets[idx] = take
 
     # Second pass: fill remaining slots from highest priority categories
-    for qtype in QUESTION_PRIORITY:
-        if len(result) >= max_questions:
+    for idx, available in enumerate(buckets):
+        remaining = max_questions - len(result)
+        if remaining <= 0:
             break
-        available = by_type.get(qtype, [])
-        for q in available:
-            if len(result) < max_questions:
-                result.append(q)
+        offset = offsets[idx]
+        result.extend(available[offset:offset + remaining])
 
     return result
 
@@ -327,23 +403,52 @@ def generate_questions_from_summary(
     Returns:
         List of prioritized Question objects
     """
-    all_questions = []
-
     # Extract data from summary
     decisions = summary.get("architectural_decisions", [])
     debugging_steps = summary.get("debugging_steps", [])
     failure_modes = summary.get("failure_modes", [])
     explanations = summary.get("explanations", [])
 
-    # Generate each type of question
-    all_questions.extend(generate_system_design_questions(decisions, explanations))
-    all_questions.extend(generate_counterfactual_questions(failure_modes, decisions))
-    all_questions.extend(generate_debugging_questions(debugging_steps))
+    # Nothing to work with - skip the generators entirely. Replayed
+    # empty sessions hit this path often.
+    if not (decisions or debugging_steps or failure_modes or explanations):
+        return []
+
+    # The three generators scan disjoint sections; for big summaries
+    # run them on a small pool (regex work releases the GIL in spurts),
+    # otherwise the thread overhead isn't worth it
+    n_items = (len(decisions) + len(debugging_steps)
+               + len(failure_modes) + len(explanations))
+    if n_items >= PARALLEL_MIN_ITEMS:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(generate_system_design_questions,
+                                decisions, explanations),
+                executor.submit(generate_counterfactual_questions,
+                                failure_modes, decisions),
+                executor.submit(generate_debugging_questions, debugging_steps),
+            ]
+            all_questions = list(chain.from_iterable(
+                f.result() for f in futures))
+    else:
+        # Flattened in one materialization
+        all_questions = list(chain(
+            generate_system_design_questions(decisions, explanations),
+            generate_counterfactual_questions(failure_modes, decisions),
+            generate_debugging_questions(debugging_steps),
+        ))
 
     # Prioritize and limit
     return prioritize_questions(all_questions, max_questions)
 
 
+# Fetches all serialized Question fields in one C-level call
+_QUESTION_FIELDS = operator.attrgetter(
+    "question_type", "question", "expected_answer", "tags", "context", "difficulty"
+)
+
+
 def save_questions(questions: list[Question], output_path: Path) -> None:
     """Save generated questions to a JSON file.
 
@@ -356,20 +461,24 @@ def save_questions(questions: list[Question], output_path: Path) -> None:
         "question_count": len(questions),
         "questions": [
             {
-                "type": q.question_type.value,
-                "question": q.question,
-                "expected_answer": q.expected_answer,
-                "tags": q.tags,
-                "context": q.context,
-                "difficulty": q.difficulty,
+                "type": qtype.value,
+                "question": question,
+                "expected_answer": expected_answer,
+                "tags": tags,
+                "context": context,
+                "difficulty": difficulty,
             }
-            for q in questions
+            for qtype, question, expected_answer, tags, context, difficulty
+            in map(_QUESTION_FIELDS, questions)
         ]
     }
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    _ensure_dir(output_path.parent)
+    if orjson is not None:
+        output_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(data, f, indent=2)
 
 
 def main():
@@ -9,24 +9,110 @@ Terminal-based quiz interface with:
 - Progress tracking
 """
 import json
+import os
 import sys
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from serialization import dumps_bytes, loads_bytes
 
-class SkipReason(Enum):
-    """Reasons for skipping a question - requires selection."""
-    TIME_PRESSURE = "time_pressure"
-    ALREADY_KNOW = "already_know"
-    UNCLEAR = "unclear"
-    OTHER = "other"
 
+# Reasons for skipping a question - requires selection. Plain interned
+# strings: they serialize and compare without Enum descriptor overhead.
+TIME_PRESSURE = sys.intern("time_pressure")
+ALREADY_KNOW = sys.intern("already_know")
+UNCLEAR = sys.intern("unclear")
+OTHER = sys.intern("other")
 
-@dataclass
+SKIP_REASONS = (TIME_PRESSURE, ALREADY_KNOW, UNCLEAR, OTHER)
+
+
+# Known question-type labels pre-interned so every result in a session
+# shares one string object per type and downstream dict hashing
+# degrades to pointer comparison
+_CANON_TYPES = {
+    t: sys.intern(t)
+    for t in ("system_design", "counterfactual", "debugging",
+              "architectural", "unknown")
+}
+
+
+def _canon_type(qtype: str) -> str:
+    """Return the shared interned object for a question-type string."""
+    return _CANON_TYPES.get(qtype) or sys.intern(qtype)
+
+
+# Display building blocks, rendered once at import instead of per call
+_TYPE_LABEL = {
+    "system_design": "SYSTEM DESIGN",
+    "counterfactual": "COUNTERFACTUAL",
+    "debugging": "DEBUGGING",
+    "architectural": "ARCHITECTURAL",
+}
+_HR = "-" * 60
+_BOX_TOP = "╭─────────────────────────────────────────────────────────────╮"
+_BOX_BOT = "╰─────────────────────────────────────────────────────────────╯"
+
+_SKIP_PROMPT = (
+    "\nYou pressed [s] to skip.\n\n"
+    "Why are you skipping? (required)\n"
+    "  [t] Time pressure - need to ship\n"
+    "  [k] Already know this well\n"
+    "  [u] Question unclear\n"
+    "  [o] Other\n\n"
+)
+
+_GRADE_PROMPT = (
+    "\nHow'd you do?\n"
+    "  [c] Correct - I got the key points\n"
+    "  [p] Partial - I missed something important\n"
+    "  [w] Wrong - I didn't understand this\n\n"
+)
+
+
+def _read_key() -> str:
+    """Read a single menu keystroke without waiting for Enter.
+
+    Puts the terminal in cbreak mode for one read, so menu selection
+    is a single keypress. Falls back to line input when stdin is not a
+    TTY (piped input, tests).
+    """
+    if not sys.stdin.isatty():
+        return input("> ").strip().lower()
+
+    import termios
+    import tty
+
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        key = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    return key.lower()
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to path via a same-directory temp file and rename.
+
+    One write syscall for the whole blob, and an interrupted process
+    never leaves a truncated result file behind. fsync on the temp fd
+    ensures the rename never publishes unflushed data after a crash.
+    """
+    tmp_path = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+@dataclass(slots=True)
 class QuizResult:
     """Result of answering a single question."""
     question_type: str
@@ -34,7 +120,7 @@ class QuizResult:
     correct: bool
     skipped: bool
     partial: bool = False
-    skip_reason: Optional[SkipReason] = None
+    skip_reason: Optional[str] = None
     skip_note: str = ""
     reflection: str = ""
     time_seconds: int = 0
@@ -51,7 +137,7 @@ class QuizResult:
             "time_seconds": self.time_seconds,
         }
         if self.skipped:
-            data["skip_reason"] = self.skip_reason.value if self.skip_reason else None
+            data["skip_reason"] = self.skip_reason
             data["skip_note"] = self.skip_note
         if self.reflection:
             data["reflection"] = self.reflection
@@ -67,14 +153,12 @@ def load_quiz(quiz_path: Path) -> list[dict]:
     Returns:
         List of question dicts
     """
-    if not quiz_path.exists():
-        return []
-
+    # EAFP: a single binary read covers the missing-file case without a
+    # preflight exists() stat, and bytes feed the fast parser directly
     try:
-        with open(quiz_path) as f:
-            data = json.load(f)
+        data = loads_bytes(quiz_path.read_bytes())
         return data.get("questions", [])
-    except (json.JSONDecodeError, IOError):
+    except (ValueError, OSError):
         return []
 
 
@@ -89,14 +173,15 @@ def format_question_display(question: dict, current: int, total: int) -> str:
     Returns:
         Formatted string for display
     """
-    qtype = question.get("type", "unknown").upper().replace("_", " ")
+    raw_type = question.get("type", "unknown")
+    qtype = _TYPE_LABEL.get(raw_type) or raw_type.upper().replace("_", " ")
     qtext = question.get("question", "")
     tags = question.get("tags", [])
 
     lines = [
         "",
         f"Q{current}/{total} [{qtype}]",
-        "-" * 60,
+        _HR,
         qtext,
         "",
         f"Tags: {', '.join(tags)}" if tags else "",
@@ -105,7 +190,7 @@ def format_question_display(question: dict, current: int, total: int) -> str:
         ""
     ]
 
-    return "\n".join(line for line in lines if line is not None)
+    return "\n".join(lines)
 
 
 def format_expected_answer(question: dict) -> str:
@@ -122,7 +207,7 @@ def format_expected_answer(question: dict) -> str:
 
     lines = [
         "",
-        "-" * 60,
+        _HR,
         "Expected answer:",
         expected,
     ]
@@ -134,7 +219,7 @@ def format_expected_answer(question: dict) -> str:
             context
         ])
 
-    lines.append("-" * 60)
+    lines.append(_HR)
 
     return "\n".join(lines)
 
@@ -157,7 +242,7 @@ def process_answer(
         QuizResult object
     """
     return QuizResult(
-        question_type=question.get("type", "unknown"),
+        question_type=_canon_type(question.get("type", "unknown")),
         tags=question.get("tags", []),
         correct=(self_grade == "correct"),
         partial=(self_grade == "partial"),
@@ -169,21 +254,21 @@ def process_answer(
 
 def process_skip(
     question: dict,
-    reason: SkipReason,
+    reason: str,
     skip_note: str = ""
 ) -> QuizResult:
     """Process a skipped question.
 
     Args:
         question: Question dict
-        reason: SkipReason enum value
+        reason: One of SKIP_REASONS
         skip_note: Optional additional note
 
     Returns:
         QuizResult object
     """
     return QuizResult(
-        question_type=question.get("type", "unknown"),
+        question_type=_canon_type(question.get("type", "unknown")),
         tags=question.get("tags", []),
         correct=False,
         skipped=True,
@@ -204,28 +289,27 @@ def save_quiz_result(
         output_path: Path to save results
         session_id: Session identifier
     """
-    total = len(results)
-    correct = sum(1 for r in results if r.correct)
-    partial = sum(1 for r in results if r.partial)
-    skipped = sum(1 for r in results if r.skipped)
-    wrong = total - correct - partial - skipped
+    from datetime import datetime
 
-    # Group results by type
+    # One pass over the results for counts, per-type groups, and skips
+    total = len(results)
+    correct = partial = skipped = 0
     by_type = {}
+    skip_reasons = {}
     for r in results:
-        qtype = r.question_type
-        if qtype not in by_type:
-            by_type[qtype] = {"correct": 0, "total": 0}
-        by_type[qtype]["total"] += 1
+        correct += r.correct
+        partial += r.partial
+        skipped += r.skipped
+
+        type_entry = by_type.setdefault(r.question_type, {"correct": 0, "total": 0})
+        type_entry["total"] += 1
         if r.correct:
-            by_type[qtype]["correct"] += 1
+            type_entry["correct"] += 1
 
-    # Group skip reasons
-    skip_reasons = {}
-    for r in results:
         if r.skipped and r.skip_reason:
-            reason = r.skip_reason.value
-            skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
+            skip_reasons[r.skip_reason] = skip_reasons.get(r.skip_reason, 0) + 1
+
+    wrong = total - correct - partial - skipped
 
     data = {
         "session_id": session_id,
@@ -244,41 +328,39 @@ def save_quiz_result(
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    # Result files are read back by the tracker, not people: skip the
+    # pretty-printing, which roughly doubles bytes written and parsed
+    _atomic_write_bytes(output_path, dumps_bytes(data))
 
 
 def print_header(project_name: str, session_date: str, question_count: int) -> None:
-    """Print quiz header."""
-    print("\n╭─────────────────────────────────────────────────────────────╮")
-    print(f"│  System Design Quiz - {project_name[:20]:<20} ({session_date})    │")
-    print(f"│  {question_count} questions · ~{question_count * 2} min                                       │")
-    print("╰─────────────────────────────────────────────────────────────╯\n")
+    """Print quiz header as one buffered write."""
+    sys.stdout.write(
+        f"\n{_BOX_TOP}\n"
+        f"│  System Design Quiz - {project_name[:20]:<20} ({session_date})    │\n"
+        f"│  {question_count} questions · ~{question_count * 2} min                                       │\n"
+        f"{_BOX_BOT}\n\n"
+    )
+    sys.stdout.flush()
 
 
-def print_skip_prompt() -> SkipReason:
+def print_skip_prompt() -> str:
     """Display skip reason prompt and get selection.
 
     Returns:
-        Selected SkipReason
+        Selected skip reason (one of SKIP_REASONS)
     """
-    print("\nYou pressed [s] to skip.\n")
-    print("Why are you skipping? (required)")
-    print("  [t] Time pressure - need to ship")
-    print("  [k] Already know this well")
-    print("  [u] Question unclear")
-    print("  [o] Other")
-    print()
+    sys.stdout.write(_SKIP_PROMPT)
 
     mapping = {
-        "t": SkipReason.TIME_PRESSURE,
-        "k": SkipReason.ALREADY_KNOW,
-        "u": SkipReason.UNCLEAR,
-        "o": SkipReason.OTHER,
+        "t": TIME_PRESSURE,
+        "k": ALREADY_KNOW,
+        "u": UNCLEAR,
+        "o": OTHER,
     }
 
     while True:
-        choice = input("> ").strip().lower()
+        choice = _read_key()
         if choice in mapping:
             return mapping[choice]
         print("Please enter t, k, u, or o")
@@ -290,16 +372,12 @@ def print_self_grade_prompt() -> tuple[str, str]:
     Returns:
         Tuple of (grade, reflection)
     """
-    print("\nHow'd you do?")
-    print("  [c] Correct - I got the key points")
-    print("  [p] Partial - I missed something important")
-    print("  [w] Wrong - I didn't understand this")
-    print()
+    sys.stdout.write(_GRADE_PROMPT)
 
     mapping = {"c": "correct", "p": "partial", "w": "wrong"}
 
     while True:
-        choice = input("> ").strip().lower()
+        choice = _read_key()
         if choice in mapping:
             break
         print("Please enter c, p, or w")
@@ -315,21 +393,27 @@ def print_self_grade_prompt() -> tuple[str, str]:
 def print_summary(results: list[QuizResult]) -> None:
     """Print quiz summary."""
     total = len(results)
-    correct = sum(1 for r in results if r.correct)
-    partial = sum(1 for r in results if r.partial)
-    skipped = sum(1 for r in results if r.skipped)
+    correct = partial = skipped = 0
+    for r in results:
+        correct += r.correct
+        partial += r.partial
+        skipped += r.skipped
 
     score = round(correct / total * 100) if total > 0 else 0
 
-    print("\n╭─────────────────────────────────────────────────────────────╮")
-    print("│  Quiz Complete!                                             │")
-    print("╰─────────────────────────────────────────────────────────────╯")
-    print(f"\n  Score: {score}% ({correct}/{total} correct)")
+    parts = [
+        f"\n{_BOX_TOP}\n",
+        "│  Quiz Complete!                                             │\n",
+        f"{_BOX_BOT}\n",
+        f"\n  Score: {score}% ({correct}/{total} correct)\n",
+    ]
     if partial:
-        print(f"  Partial: {partial}")
+        parts.append(f"  Partial: {partial}\n")
     if skipped:
-        print(f"  Skipped: {skipped}")
-    print()
+        parts.append(f"  Skipped: {skipped}\n")
+    parts.append("\n")
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 
 def run_interactive_quiz(
@@ -352,60 +436,64 @@ def run_interactive_quiz(
         print("No questions found in quiz file.")
         return []
 
+    from datetime import datetime
+
     session_date = datetime.now().strftime("%b %d")
     print_header(project_name, session_date, len(questions))
 
     results = []
 
     for i, question in enumerate(questions, 1):
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
-        # Display question
-        print(format_question_display(question, i, len(questions)))
-
-        # Get answer
-        print("Your answer:")
+        # Display question and answer prompt as one screen write
+        sys.stdout.write(
+            format_question_display(question, i, len(questions)) + "\nYour answer:\n"
+        )
+        sys.stdout.flush()
         user_input = input("> ").strip()
 
         # Handle special commands
         if user_input.lower() == "s":
             reason = print_skip_prompt()
             skip_note = ""
-            if reason == SkipReason.OTHER:
+            if reason == OTHER:
                 skip_note = input("Note: ").strip()
 
             result = process_skip(question, reason, skip_note)
-            result.time_seconds = int(time.time() - start_time)
+            result.time_seconds = (time.monotonic_ns() - start_ns) // 1_000_000_000
             results.append(result)
-            print("\nNoted. Question deferred to next session.\n")
+            sys.stdout.write("\nNoted. Question deferred to next session.\n\n")
+            sys.stdout.flush()
             continue
 
         if user_input.lower() == "h":
             # Show hint (partial expected answer)
             expected = question.get("expected_answer", "")
             hint = expected[:len(expected)//3] + "..."
-            print(f"\nHint: {hint}\n")
-            print("Your answer:")
+            sys.stdout.write(f"\nHint: {hint}\n\nYour answer:\n")
+            sys.stdout.flush()
             user_input = input("> ").strip()
 
         if user_input.lower() == "?":
             # Show context
             context = question.get("context", "No additional context available.")
-            print(f"\nContext: {context}\n")
-            print("Your answer:")
+            sys.stdout.write(f"\nContext: {context}\n\nYour answer:\n")
+            sys.stdout.flush()
             user_input = input("> ").strip()
 
         # Show expected answer
-        print(format_expected_answer(question))
+        sys.stdout.write(format_expected_answer(question) + "\n")
+        sys.stdout.flush()
 
         # Self-grade
         grade, reflection = print_self_grade_prompt()
 
         result = process_answer(question, user_input, grade, reflection)
-        result.time_seconds = int(time.time() - start_time)
+        result.time_seconds = (time.monotonic_ns() - start_ns) // 1_000_000_000
         results.append(result)
 
-        print()
+        sys.stdout.write("\n")
 
     # Show summary
     print_summary(results)
@@ -429,9 +517,8 @@ def main():
         # Look for most recent quiz in current project
         quiz_dir = Path.cwd() / ".claude" / "quizzes"
         if quiz_dir.exists():
-            quizzes = sorted(quiz_dir.glob("*.json"), reverse=True)
-            if quizzes:
-                args.quiz_file = quizzes[0]
+            # Single O(N) max beats sorting the whole directory
+            args.quiz_file = max(quiz_dir.glob("*.json"), default=None)
 
     if not args.quiz_file or not args.quiz_file.exists():
         print("No quiz file found. Generate one with /quiz-generate first.")
@@ -449,6 +536,8 @@ def main():
         if args.output:
             output_path = args.output
         else:
+            from datetime import datetime
+
             results_dir = args.quiz_file.parent.parent / "quiz-results"
             date_str = datetime.now().strftime("%Y-%m-%d")
             output_path = results_dir / f"{date_str}-{args.session_id[:8]}-result.json"
@@ -8,20 +8,121 @@ Tracks quiz results over time to:
 - Analyze skip patterns
 - Generate weekly reports
 """
+import io
 import json
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator - stdlib json works fine
+    orjson = None
+
+try:
+    import numpy
+except ImportError:  # Optional accelerator - Counter fallback works fine
+    numpy = None
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse JSON bytes with the fastest available parser."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps_indented(data) -> bytes:
+    """Serialize to human-readable JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _dumps(data) -> bytes:
+    """Serialize to compact JSON bytes for machine-consumed files."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to path via a same-directory temp file and rename.
+
+    Readers never observe a partially written file, and an interrupted
+    write leaves the previous contents intact. fsync on the temp fd
+    ensures the rename never publishes unflushed data after a crash.
+    """
+    tmp_path = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+@lru_cache(maxsize=256)
+def _pretty_topic(topic: str) -> str:
+    """Display form of a topic key, cached since topics repeat across sections."""
+    return topic.replace("_", " ").title()
+
 
 # Thresholds for categorizing performance
 WEAK_THRESHOLD = 0.5  # Below 50% = weak
 STRONG_THRESHOLD = 0.7  # Above 70% = strong
 
+# Incremental scan cache, stored alongside the result files it indexes
+SCAN_CACHE_NAME = ".cache.json"
+
+# Below this many (type/tag, correct) observations the numpy path costs
+# more than it saves
+VECTORIZE_MIN_KEYS = 2000
+
+
+def _tally_keys(keys: list[str], correct_flags: list[bool]) -> tuple[Counter, Counter]:
+    """Count totals and corrects for a flat list of topic keys.
 
-@dataclass
+    Large histories take a vectorized path: keys are factorized to
+    integer codes and counted with numpy.bincount in C, instead of one
+    interpreter-level Counter update per observation.
+
+    Args:
+        keys: Topic/tag key per observation
+        correct_flags: Whether the observation's question was correct
+
+    Returns:
+        Tuple of (totals, corrects) Counters keyed by topic
+    """
+    if numpy is not None and len(keys) >= VECTORIZE_MIN_KEYS:
+        index: dict[str, int] = {}
+        codes = [index.setdefault(k, len(index)) for k in keys]
+        code_arr = numpy.asarray(codes, dtype=numpy.intp)
+        totals_arr = numpy.bincount(code_arr, minlength=len(index))
+        corrects_arr = numpy.bincount(
+            code_arr,
+            weights=numpy.asarray(correct_flags, dtype=numpy.float64),
+            minlength=len(index),
+        )
+        totals = Counter({k: int(totals_arr[c]) for k, c in index.items()})
+        corrects = Counter(
+            {k: int(corrects_arr[c]) for k, c in index.items() if corrects_arr[c]}
+        )
+        return totals, corrects
+
+    totals = Counter(keys)
+    corrects = Counter(k for k, flag in zip(keys, correct_flags) if flag)
+    return totals, corrects
+
+
+@dataclass(slots=True)
 class BlindSpotReport:
     """Weekly blind spot report."""
     weak_areas: list[tuple[str, int]] = field(default_factory=list)  # (topic, percent)
@@ -33,45 +134,51 @@ class BlindSpotReport:
 
     def to_markdown(self) -> str:
         """Convert report to markdown format."""
-        lines = [
-            "╭─────────────────────────────────────────────────────────────╮",
-            "│  Weekly Blind Spot Report                                   │",
-            "╰─────────────────────────────────────────────────────────────╯",
-            "",
-        ]
+        # Write straight into one growing buffer instead of collecting
+        # lines and joining them afterwards
+        buf = io.StringIO()
+        w = buf.write
+
+        w(
+            "╭─────────────────────────────────────────────────────────────╮\n"
+            "│  Weekly Blind Spot Report                                   │\n"
+            "╰─────────────────────────────────────────────────────────────╯\n"
+            "\n"
+        )
 
         if self.weak_areas:
-            lines.append("🔴 Weak areas (< 50% correct):")
+            w("🔴 Weak areas (< 50% correct):\n")
             for topic, pct in self.weak_areas:
-                lines.append(f"   • {topic.replace('_', ' ').title()} ({pct}%)")
-            lines.append("")
+                w(f"   • {_pretty_topic(topic)} ({pct}%)\n")
+            w("\n")
 
         if self.needs_work:
-            lines.append("🟡 Needs work (50-70%):")
+            w("🟡 Needs work (50-70%):\n")
             for topic, pct in self.needs_work:
-                lines.append(f"   • {topic.replace('_', ' ').title()} ({pct}%)")
-            lines.append("")
+                w(f"   • {_pretty_topic(topic)} ({pct}%)\n")
+            w("\n")
 
         if self.strong_areas:
-            lines.append("🟢 Strong areas (> 70%):")
+            w("🟢 Strong areas (> 70%):\n")
             for topic, pct in self.strong_areas:
-                lines.append(f"   • {topic.replace('_', ' ').title()} ({pct}%)")
-            lines.append("")
+                w(f"   • {_pretty_topic(topic)} ({pct}%)\n")
+            w("\n")
 
         if self.skip_patterns:
-            lines.append("📝 Skip patterns:")
+            w("📝 Skip patterns:\n")
             for reason, count in self.skip_patterns.items():
                 reason_text = reason.replace("_", " ")
-                lines.append(f"   • {count} skips due to \"{reason_text}\"")
-            lines.append("")
+                w(f"   • {count} skips due to \"{reason_text}\"\n")
+            w("\n")
 
         if self.suggestions:
-            lines.append("💡 Suggestions:")
+            w("💡 Suggestions:\n")
             for suggestion in self.suggestions:
-                lines.append(f"   {suggestion}")
-            lines.append("")
+                w(f"   {suggestion}\n")
+            w("\n")
 
-        return "\n".join(lines)
+        # Drop the final section separator to match the joined layout
+        return buf.getvalue()[:-1]
 
     def to_dict(self) -> dict:
         """Serialize to dictionary."""
@@ -85,6 +192,35 @@ class BlindSpotReport:
         }
 
 
+def _list_result_files(results_dir: Path) -> list[os.DirEntry]:
+    """List result files via one scandir pass, sorted by filename.
+
+    os.scandir reads the directory in a single readdir and serves
+    is_file from the cached dirent, avoiding the per-entry PurePath
+    construction and extra stat of Path.glob. Dotfiles are skipped:
+    the scan cache lives in this directory as .cache.json.
+
+    Args:
+        results_dir: The .claude/quiz-results directory
+
+    Returns:
+        List of directory entries for result files, oldest name first
+    """
+    try:
+        with os.scandir(results_dir) as it:
+            entries = [
+                e for e in it
+                if e.name.endswith(".json")
+                and not e.name.startswith(".")
+                and e.is_file()
+            ]
+    except OSError:
+        return []
+
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
 def load_all_results(project_path: Path) -> list[dict]:
     """Load all quiz results for a project.
 
@@ -95,72 +231,277 @@ def load_all_results(project_path: Path) -> list[dict]:
         List of result dicts
     """
     results_dir = project_path / ".claude" / "quiz-results"
-    if not results_dir.exists():
+
+    files = _list_result_files(results_dir)
+    if not files:
         return []
 
+    def _read(path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    paths = [e.path for e in files]
+    if len(paths) < 8:
+        # Pool spin-up costs more than it saves for a handful of files
+        blobs = map(_read, paths)
+    else:
+        # Overlap the file reads; parsing happens after the pool drains
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            blobs = executor.map(_read, paths)
+
     results = []
-    for result_file in results_dir.glob("*.json"):
+    for raw in blobs:
+        if raw is None:
+            continue
         try:
-            with open(result_file) as f:
-                results.append(json.load(f))
-        except (json.JSONDecodeError, IOError):
+            results.append(_loads(raw))
+        except ValueError:
             continue
 
     return results
 
 
-def calculate_topic_scores(results: list[dict]) -> dict[str, dict]:
-    """Calculate scores broken down by topic/type and tag.
+def iter_results(project_path: Path):
+    """Yield quiz results for a project one file at a time.
+
+    Streaming counterpart to load_all_results: single-pass consumers
+    hold at most one parsed result in memory instead of materializing
+    the whole quiz history.
 
     Args:
-        results: List of quiz result dicts
+        project_path: Path to the project directory
+
+    Yields:
+        Result dicts in filename order
+    """
+    results_dir = project_path / ".claude" / "quiz-results"
+
+    for entry in _list_result_files(results_dir):
+        try:
+            with open(entry.path, "rb") as f:
+                yield _loads(f.read())
+        except (OSError, ValueError):
+            continue
+
+
+def scan_results(results) -> tuple[dict[str, dict], dict[str, int], dict]:
+    """Compute topic scores, skip patterns, and aggregate stats in one pass.
+
+    Fuses calculate_topic_scores, get_skip_patterns, and aggregate_results
+    so each result dict is touched exactly once. Accepts any iterable of
+    result dicts, including the iter_results generator.
+
+    Args:
+        results: Iterable of quiz result dicts
 
     Returns:
-        Dict mapping topic/tag to {correct, total}
+        Tuple of (topic_scores, skip_patterns, aggregate stats)
     """
-    scores = {}
+    keys: list[str] = []
+    correct_flags: list[bool] = []
+    skip_patterns: Counter = Counter()
+    total_quizzes = 0
+    total_questions = 0
+    total_correct = 0
+    total_skipped = 0
 
     for result in results:
+        total_quizzes += 1
+
         for question in result.get("questions", []):
-            qtype = question.get("type", "unknown")
+            # Type and tags share the same counting logic, so buffer
+            # them as flat observation lists and tally at the end
             correct = question.get("correct", False)
-            tags = question.get("tags", [])
+            for key in (question.get("type", "unknown"), *question.get("tags", ())):
+                keys.append(key)
+                correct_flags.append(correct)
+
+        for reason, count in result.get("skip_reasons", {}).items():
+            skip_patterns[reason] += count
+
+        summary = result.get("summary", {})
+        total_questions += summary.get("total", 0)
+        total_correct += summary.get("correct", 0)
+        total_skipped += summary.get("skipped", 0)
+
+    totals, corrects = _tally_keys(keys, correct_flags)
+
+    topic_scores = {
+        topic: {"correct": corrects[topic], "total": total}
+        for topic, total in totals.items()
+    }
+    aggregate = {
+        "total_quizzes": total_quizzes,
+        "total_questions": total_questions,
+        "total_correct": total_correct,
+        "total_skipped": total_skipped,
+        "overall_score": round(total_correct / total_questions * 100) if total_questions > 0 else 0,
+    }
+
+    return topic_scores, dict(skip_patterns), aggregate
+
+
+def _scan_partial(result: dict) -> dict:
+    """Reduce one result file to the counters scan_results needs.
+
+    The partial is JSON-serializable so it can live in the scan cache;
+    merging partials is O(unique topics) instead of O(questions).
+
+    Args:
+        result: A single quiz result dict
+
+    Returns:
+        Dict of per-file counters and summary totals
+    """
+    totals: Counter = Counter()
+    corrects: Counter = Counter()
+
+    for question in result.get("questions", []):
+        keys = (question.get("type", "unknown"), *question.get("tags", ()))
+        totals.update(keys)
+        if question.get("correct", False):
+            corrects.update(keys)
+
+    summary = result.get("summary", {})
+    return {
+        "totals": dict(totals),
+        "corrects": dict(corrects),
+        "skips": result.get("skip_reasons", {}),
+        "questions": summary.get("total", 0),
+        "correct": summary.get("correct", 0),
+        "skipped": summary.get("skipped", 0),
+    }
+
+
+def load_all_scans(project_path: Path) -> list[dict]:
+    """Load per-file scan partials, parsing only new or changed files.
+
+    Result files are immutable once written by save_quiz_result, so
+    their partials are cached in .claude/quiz-results/.cache.json keyed
+    by (filename, mtime_ns, size). A report over a long history then
+    costs O(new files) instead of re-parsing everything.
+
+    Args:
+        project_path: Path to the project directory
+
+    Returns:
+        List of partial dicts as produced by _scan_partial
+    """
+    results_dir = project_path / ".claude" / "quiz-results"
+    if not results_dir.exists():
+        return []
+
+    cache_path = results_dir / SCAN_CACHE_NAME
+    try:
+        cache = _loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+
+    partials = []
+    fresh_cache = {}
+    dirty = False
+
+    for entry in _list_result_files(results_dir):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+
+        key = f"{entry.name}:{stat.st_mtime_ns}:{stat.st_size}"
+        partial = cache.get(key)
+        if partial is None:
+            try:
+                with open(entry.path, "rb") as f:
+                    partial = _scan_partial(_loads(f.read()))
+            except (OSError, ValueError):
+                continue
+            dirty = True
+
+        fresh_cache[key] = partial
+        partials.append(partial)
+
+    # Rewrite when anything was parsed or stale entries were dropped
+    if dirty or len(fresh_cache) != len(cache):
+        try:
+            _atomic_write_bytes(cache_path, _dumps(fresh_cache))
+        except OSError:
+            pass
+
+    return partials
+
+
+def scan_project(project_path: Path) -> tuple[dict[str, dict], dict[str, int], dict]:
+    """Cached equivalent of scan_results over a project's history.
+
+    Merges the partials from load_all_scans by Counter addition.
+
+    Args:
+        project_path: Path to the project directory
+
+    Returns:
+        Tuple of (topic_scores, skip_patterns, aggregate stats)
+    """
+    partials = load_all_scans(project_path)
+
+    totals: Counter = Counter()
+    corrects: Counter = Counter()
+    skip_patterns: Counter = Counter()
+    total_questions = 0
+    total_correct = 0
+    total_skipped = 0
+
+    for partial in partials:
+        totals.update(partial["totals"])
+        corrects.update(partial["corrects"])
+        skip_patterns.update(partial["skips"])
+        total_questions += partial["questions"]
+        total_correct += partial["correct"]
+        total_skipped += partial["skipped"]
+
+    topic_scores = {
+        topic: {"correct": corrects[topic], "total": total}
+        for topic, total in totals.items()
+    }
+    aggregate = {
+        "total_quizzes": len(partials),
+        "total_questions": total_questions,
+        "total_correct": total_correct,
+        "total_skipped": total_skipped,
+        "overall_score": round(total_correct / total_questions * 100) if total_questions > 0 else 0,
+    }
 
-            # Track by type
-            if qtype not in scores:
-                scores[qtype] = {"correct": 0, "total": 0}
-            scores[qtype]["total"] += 1
-            if correct:
-                scores[qtype]["correct"] += 1
+    return topic_scores, dict(skip_patterns), aggregate
 
-            # Track by tag
-            for tag in tags:
-                if tag not in scores:
-                    scores[tag] = {"correct": 0, "total": 0}
-                scores[tag]["total"] += 1
-                if correct:
-                    scores[tag]["correct"] += 1
 
-    return scores
+def calculate_topic_scores(results: list[dict]) -> dict[str, dict]:
+    """Calculate scores broken down by topic/type and tag.
+
+    Thin wrapper over scan_results for callers that only need scores.
+
+    Args:
+        results: List of quiz result dicts
+
+    Returns:
+        Dict mapping topic/tag to {correct, total}
+    """
+    return scan_results(results)[0]
 
 
 def get_skip_patterns(results: list[dict]) -> dict[str, int]:
     """Aggregate skip reasons across all results.
 
+    Thin wrapper over scan_results for callers that only need skips.
+
     Args:
         results: List of quiz result dicts
 
     Returns:
         Dict mapping skip reason to count
     """
-    patterns = {}
-
-    for result in results:
-        skip_reasons = result.get("skip_reasons", {})
-        for reason, count in skip_reasons.items():
-            patterns[reason] = patterns.get(reason, 0) + count
-
-    return patterns
+    return scan_results(results)[1]
 
 
 def generate_blind_spot_report(
@@ -196,13 +537,14 @@ def generate_blind_spot_report(
         else:
             strong_areas.append((topic, pct))
 
-    # Sort by percentage
+    # Sort by percentage for display
     weak_areas.sort(key=lambda x: x[1])
     needs_work.sort(key=lambda x: x[1])
     strong_areas.sort(key=lambda x: x[1], reverse=True)
 
-    # Generate suggestions based on weak areas
-    for topic, pct in weak_areas[:3]:  # Top 3 weakest
+    # Generate suggestions based on the three weakest areas - the
+    # display sort already put them up front
+    for topic, pct in weak_areas[:3]:
         topic_text = topic.replace("_", " ")
         suggestions.append(
             f"Next session, pay extra attention when Claude discusses {topic_text}."
@@ -225,77 +567,53 @@ def generate_blind_spot_report(
 def aggregate_results(results: list[dict]) -> dict:
     """Aggregate statistics across all quiz results.
 
+    Thin wrapper over scan_results for callers that only need totals.
+
     Args:
         results: List of quiz result dicts
 
     Returns:
         Aggregated statistics dict
     """
-    if not results:
-        return {
-            "total_quizzes": 0,
-            "total_questions": 0,
-            "total_correct": 0,
-            "total_skipped": 0,
-            "overall_score": 0,
-        }
-
-    total_quizzes = len(results)
-    total_questions = 0
-    total_correct = 0
-    total_skipped = 0
-
-    for result in results:
-        summary = result.get("summary", {})
-        total_questions += summary.get("total", 0)
-        total_correct += summary.get("correct", 0)
-        total_skipped += summary.get("skipped", 0)
-
-    overall_score = round(total_correct / total_questions * 100) if total_questions > 0 else 0
-
-    return {
-        "total_quizzes": total_quizzes,
-        "total_questions": total_questions,
-        "total_correct": total_correct,
-        "total_skipped": total_skipped,
-        "overall_score": overall_score,
-    }
+    return scan_results(results)[2]
 
 
 def merge_result_into_state(state: dict, result: dict) -> dict:
     """Merge a quiz result into the persistent state.
 
-    Updates topic_scores with new results.
+    State keeps flat "totals"/"corrects" count maps so merging is plain
+    Counter updates with no per-topic membership checks; the legacy
+    nested topic_scores shape is migrated on first touch and re-derived
+    at the end for readers of the old schema.
 
     Args:
-        state: Current quiz state (with topic_scores)
+        state: Current quiz state
         result: New quiz result to merge
 
     Returns:
         Updated state
     """
-    if "topic_scores" not in state:
-        state["topic_scores"] = {}
+    totals = Counter(state.get("totals") or {})
+    corrects = Counter(state.get("corrects") or {})
+
+    if not totals:
+        # Migrate the legacy nested shape into the flat counters
+        for topic, entry in state.get("topic_scores", {}).items():
+            totals[topic] = entry.get("total", 0)
+            corrects[topic] = entry.get("correct", 0)
 
     for question in result.get("questions", []):
-        qtype = question.get("type", "unknown")
-        correct = question.get("correct", False)
-        tags = question.get("tags", [])
-
-        # Update type scores
-        if qtype not in state["topic_scores"]:
-            state["topic_scores"][qtype] = {"correct": 0, "total": 0}
-        state["topic_scores"][qtype]["total"] += 1
-        if correct:
-            state["topic_scores"][qtype]["correct"] += 1
-
-        # Update tag scores
-        for tag in tags:
-            if tag not in state["topic_scores"]:
-                state["topic_scores"][tag] = {"correct": 0, "total": 0}
-            state["topic_scores"][tag]["total"] += 1
-            if correct:
-                state["topic_scores"][tag]["correct"] += 1
+        keys = (question.get("type", "unknown"), *question.get("tags", ()))
+        totals.update(keys)
+        if question.get("correct", False):
+            corrects.update(keys)
+
+    state["totals"] = dict(totals)
+    state["corrects"] = dict(corrects)
+    state["topic_scores"] = {
+        topic: {"correct": corrects[topic], "total": total}
+        for topic, total in totals.items()
+    }
 
     return state
 
@@ -316,13 +634,17 @@ def save_weekly_report(report: BlindSpotReport, project_path: Path) -> Path:
     date_str = datetime.now().strftime("%Y-%m-%d")
     report_path = reports_dir / f"weekly-{date_str}.json"
 
-    with open(report_path, "w") as f:
-        json.dump(report.to_dict(), f, indent=2)
-
-    # Also save markdown version
     md_path = reports_dir / f"weekly-{date_str}.md"
-    with open(md_path, "w") as f:
-        f.write(report.to_markdown())
+
+    # The json and markdown siblings are independent; overlap the writes
+    # but await both so a failed write still raises to the caller
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(_atomic_write_bytes, report_path, _dumps_indented(report.to_dict())),
+            executor.submit(_atomic_write_bytes, md_path, report.to_markdown().encode()),
+        ]
+        for future in futures:
+            future.result()
 
     return report_path
 
@@ -339,13 +661,12 @@ def main():
     args = parser.parse_args()
 
     if args.command == "report":
-        results = load_all_results(args.project)
-        if not results:
+        # One cached pass for all three aggregates
+        topic_scores, skip_patterns, aggregated = scan_project(args.project)
+        if aggregated["total_quizzes"] == 0:
             print("No quiz results found.")
             sys.exit(0)
 
-        topic_scores = calculate_topic_scores(results)
-        skip_patterns = get_skip_patterns(results)
         report = generate_blind_spot_report(topic_scores, skip_patterns)
 
         print(report.to_markdown())
@@ -355,8 +676,7 @@ def main():
         print(f"\nReport saved to {report_path}")
 
     elif args.command == "stats":
-        results = load_all_results(args.project)
-        aggregated = aggregate_results(results)
+        _, _, aggregated = scan_project(args.project)
 
         print(f"Total quizzes: {aggregated['total_quizzes']}")
         print(f"Total questions: {aggregated['total_questions']}")
@@ -372,22 +692,20 @@ def main():
         # Load current state
         state_file = args.project / ".claude" / "quiz-results.json"
         if state_file.exists():
-            with open(state_file) as f:
-                state = json.load(f)
+            state = _loads(state_file.read_bytes())
         else:
             state = {"topic_scores": {}, "results_history": []}
 
         # Load result
-        with open(args.result) as f:
-            result = json.load(f)
+        result = _loads(args.result.read_bytes())
 
         # Merge
         state = merge_result_into_state(state, result)
 
         # Save
         state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        # Machine-consumed state: compact bytes halve the next parse
+        _atomic_write_bytes(state_file, _dumps(state))
 
         print(f"Merged result into {state_file}")
 
@@ -10,8 +10,12 @@ Manages quiz scheduling based on the Ebbinghaus forgetting curve:
 
 Per-project tracking in <project>/.claude/quiz-state.json
 """
+import bisect
+import copy
+import hashlib
 import json
-import subprocess
+import os
+import shutil
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -19,6 +23,18 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator - stdlib json works fine
+    orjson = None
+
+
+def _dumps_indented(data) -> bytes:
+    """Serialize to human-readable JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
 
 class ScheduleType(Enum):
     """Types of quiz schedules based on spaced repetition."""
@@ -37,8 +53,16 @@ DEFAULT_CONFIG = {
     "min_activities": 5,
 }
 
+# Defaults resolved once at import so the common config=None calls skip
+# the per-field dict lookups entirely
+_SAME_DAY_DELAY_HOURS = DEFAULT_CONFIG["same_day_delay_hours"]
+_NEXT_DAY_HOUR = DEFAULT_CONFIG["next_day_hour"]
+_WEEKLY_DAY = DEFAULT_CONFIG["weekly_day"]
+_MIN_SESSION_MINUTES = DEFAULT_CONFIG["min_session_minutes"]
+_MIN_ACTIVITIES = DEFAULT_CONFIG["min_activities"]
+
 
-@dataclass
+@dataclass(slots=True)
 class QuizSchedule:
     """A scheduled quiz."""
     session_id: str
@@ -56,9 +80,11 @@ class QuizSchedule:
         return {
             "session_id": self.session_id,
             "type": self.schedule_type.value,
-            "scheduled_for": self.scheduled_for.isoformat(),
+            # Fixed microsecond width keeps stored timestamps uniform so
+            # get_due_quizzes can compare them as plain strings
+            "scheduled_for": self.scheduled_for.isoformat(timespec="microseconds"),
             "summary_path": self.summary_path,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at.isoformat(timespec="microseconds"),
         }
 
     @classmethod
@@ -73,8 +99,79 @@ class QuizSchedule:
         )
 
 
-def load_quiz_state(project_path: Path) -> dict:
-    """Load quiz state for a project.
+# Compact the append-only journal back into the snapshot once it
+# accumulates this many operations
+STATE_LOG_MAX_OPS = 100
+
+# Digest of the last snapshot this process wrote per project, so a save
+# with unchanged contents skips the write + fsync entirely
+_SNAPSHOT_HASHES: dict[Path, bytes] = {}
+
+# Per-process state cache keyed by the snapshot and journal stats, so
+# repeated hook firings don't re-read and re-parse unchanged files
+_STATE_CACHE: dict[Path, tuple[tuple, dict]] = {}
+
+
+def _file_key(path: Path) -> Optional[tuple[int, int]]:
+    """(mtime_ns, size) identity for a file, or None if it's absent."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _apply_op(state: dict, op: dict) -> None:
+    """Apply one journaled operation to the state dict."""
+    kind = op.get("op")
+    if kind == "add":
+        bisect.insort(state.setdefault("pending_quizzes", []), op["quiz"],
+                      key=lambda q: q["scheduled_for"])
+    elif kind == "complete":
+        session_id = op["session_id"]
+        state["pending_quizzes"] = [
+            q for q in state.get("pending_quizzes", [])
+            if q["session_id"] != session_id
+        ]
+        state.setdefault("completed_quizzes", []).append({
+            "session_id": session_id,
+            "completed_at": op["completed_at"],
+            "result": op["result"],
+        })
+
+
+def _append_state_op(project_path: Path, op: dict) -> None:
+    """Append one operation line to the quiz-state journal.
+
+    A single O(1) write regardless of history size, versus rewriting
+    the whole snapshot.
+    """
+    state_dir = project_path / ".claude"
+    state_dir.mkdir(parents=True, exist_ok=True)
+
+    with open(state_dir / "quiz-state.log", "a") as f:
+        f.write(json.dumps(op) + "\n")
+
+    _STATE_CACHE.pop(project_path, None)
+
+
+def _default_state(project_path: Path) -> dict:
+    """Fresh default state for a project with no quiz-state.json."""
+    return {
+        "project": project_path.name,
+        "sessions": [],
+        "pending_quizzes": [],
+        "completed_quizzes": [],
+    }
+
+
+def load_quiz_state_ro(project_path: Path) -> dict:
+    """Load quiz state for reading only.
+
+    Reads the snapshot, replays any journaled operations over it, and
+    compacts the journal back into the snapshot once it grows past
+    STATE_LOG_MAX_OPS. Returns the cached dict directly when neither
+    file changed since the last load - callers must not mutate it.
 
     Args:
         project_path: Path to the project directory
@@ -83,21 +180,68 @@ def load_quiz_state(project_path: Path) -> dict:
         Quiz state dict, creating default if not exists
     """
     state_file = project_path / ".claude" / "quiz-state.json"
+    log_file = project_path / ".claude" / "quiz-state.log"
+
+    key = (_file_key(state_file), _file_key(log_file))
+    if key == (None, None):
+        return _default_state(project_path)
+
+    cached = _STATE_CACHE.get(project_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
-    if state_file.exists():
+    state = _default_state(project_path)
+    if key[0] is not None:
         try:
             with open(state_file) as f:
-                return json.load(f)
+                state = json.load(f)
         except (json.JSONDecodeError, IOError):
             pass
+        else:
+            # Snapshots written before the sorted-pending invariant
+            # appended in creation order; restore the order bisect
+            # relies on (no-op on already-sorted lists)
+            pending = state.get("pending_quizzes")
+            if pending:
+                pending.sort(key=lambda q: q["scheduled_for"])
+
+    # Replay the journal over the snapshot
+    ops = 0
+    if key[1] is not None:
+        try:
+            with open(log_file) as f:
+                for line in f:
+                    try:
+                        op = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    _apply_op(state, op)
+                    ops += 1
+        except IOError:
+            pass
 
-    # Return default state
-    return {
-        "project": project_path.name,
-        "sessions": [],
-        "pending_quizzes": [],
-        "completed_quizzes": [],
-    }
+    if ops > STATE_LOG_MAX_OPS:
+        # Fold the journal into a fresh snapshot
+        save_quiz_state(project_path, state)
+        key = (_file_key(state_file), _file_key(log_file))
+
+    _STATE_CACHE[project_path] = (key, state)
+    return state
+
+
+def load_quiz_state(project_path: Path) -> dict:
+    """Load quiz state for a project.
+
+    Served from the per-process cache when the file is unchanged; the
+    returned dict is a private copy the caller may freely mutate.
+
+    Args:
+        project_path: Path to the project directory
+
+    Returns:
+        Quiz state dict, creating default if not exists
+    """
+    return copy.deepcopy(load_quiz_state_ro(project_path))
 
 
 def save_quiz_state(project_path: Path, state: dict) -> None:
@@ -110,9 +254,31 @@ def save_quiz_state(project_path: Path, state: dict) -> None:
     state_dir = project_path / ".claude"
     state_dir.mkdir(parents=True, exist_ok=True)
 
-    state_file = state_dir / "quiz-state.json"
-    with open(state_file, "w") as f:
-        json.dump(state, f, indent=2)
+    payload = _dumps_indented(state)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+
+    if _SNAPSHOT_HASHES.get(project_path) != digest:
+        # Atomic snapshot: a crash mid-write leaves the old state intact
+        state_file = state_dir / "quiz-state.json"
+        tmp_file = state_dir / f"quiz-state.json.tmp.{os.getpid()}"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+            # Flush before rename so a crash can't publish unwritten data
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_file, state_file)
+        _SNAPSHOT_HASHES[project_path] = digest
+
+    # The snapshot supersedes any journaled operations
+    try:
+        os.unlink(state_dir / "quiz-state.log")
+    except OSError:
+        pass
+
+    # Drop any cached copy so the next load re-reads the new contents
+    _STATE_CACHE.pop(project_path, None)
 
 
 def should_schedule_quiz(summary: dict, config: dict = None) -> bool:
@@ -125,20 +291,19 @@ def should_schedule_quiz(summary: dict, config: dict = None) -> bool:
     Returns:
         True if quiz should be scheduled
     """
-    config = config or DEFAULT_CONFIG
+    if config is None:
+        min_minutes = _MIN_SESSION_MINUTES
+        min_activities = _MIN_ACTIVITIES
+    else:
+        min_minutes = config.get("min_session_minutes", _MIN_SESSION_MINUTES)
+        min_activities = config.get("min_activities", _MIN_ACTIVITIES)
 
     duration = summary.get("duration_minutes", 0)
     stats = summary.get("stats", {})
     total_activities = stats.get("total_activities", 0)
 
     # Must meet minimum thresholds
-    if duration < config.get("min_session_minutes", 15):
-        return False
-
-    if total_activities < config.get("min_activities", 5):
-        return False
-
-    return True
+    return duration >= min_minutes and total_activities >= min_activities
 
 
 def schedule_quiz(
@@ -158,40 +323,70 @@ def schedule_quiz(
     Returns:
         QuizSchedule object
     """
-    config = config or DEFAULT_CONFIG
+    return QuizSchedule(
+        session_id=session_id,
+        schedule_type=schedule_type,
+        scheduled_for=_compute_scheduled_for(schedule_type, config),
+        summary_path=summary_path,
+    )
+
+
+def _compute_scheduled_for(schedule_type: ScheduleType,
+                           config: dict = None) -> datetime:
+    """Compute the due time for a schedule type."""
+    if config is None:
+        delay_hours = _SAME_DAY_DELAY_HOURS
+        next_day_hour = _NEXT_DAY_HOUR
+        weekly_day = _WEEKLY_DAY
+    else:
+        delay_hours = config.get("same_day_delay_hours", _SAME_DAY_DELAY_HOURS)
+        next_day_hour = config.get("next_day_hour", _NEXT_DAY_HOUR)
+        weekly_day = config.get("weekly_day", _WEEKLY_DAY)
+
     now = datetime.now()
 
     if schedule_type == ScheduleType.SAME_DAY:
-        delay_hours = config.get("same_day_delay_hours", 4)
-        scheduled_for = now + timedelta(hours=delay_hours)
+        return now + timedelta(hours=delay_hours)
 
-    elif schedule_type == ScheduleType.NEXT_DAY:
+    if schedule_type == ScheduleType.NEXT_DAY:
         tomorrow = now + timedelta(days=1)
-        next_day_hour = config.get("next_day_hour", 9)
-        scheduled_for = tomorrow.replace(
+        return tomorrow.replace(
             hour=next_day_hour, minute=0, second=0, microsecond=0
         )
 
-    elif schedule_type == ScheduleType.WEEKLY:
-        # Find next occurrence of weekly_day
-        weekly_day = config.get("weekly_day", 4)  # Friday
+    if schedule_type == ScheduleType.WEEKLY:
+        # Find next occurrence of weekly_day (Friday by default)
         days_ahead = weekly_day - now.weekday()
         if days_ahead <= 0:  # Target day already happened this week
             days_ahead += 7
         target_date = now + timedelta(days=days_ahead)
-        scheduled_for = target_date.replace(
-            hour=9, minute=0, second=0, microsecond=0
-        )
+        return target_date.replace(hour=9, minute=0, second=0, microsecond=0)
 
-    else:  # ON_DEMAND
-        scheduled_for = now
+    return now  # ON_DEMAND
 
-    return QuizSchedule(
-        session_id=session_id,
-        schedule_type=schedule_type,
-        scheduled_for=scheduled_for,
-        summary_path=summary_path,
+
+def schedule_quiz_dict(
+    session_id: str,
+    schedule_type: ScheduleType,
+    summary_path: str,
+    config: dict = None
+) -> dict:
+    """Create a quiz schedule in its stored dict form.
+
+    Equivalent to ``schedule_quiz(...).to_dict()`` without the
+    intermediate QuizSchedule: state only ever holds the dict with ISO
+    strings, so internal callers skip the dataclass round-trip.
+    """
+    iso = _compute_scheduled_for(schedule_type, config).isoformat(
+        timespec="microseconds"
     )
+    return {
+        "session_id": session_id,
+        "type": schedule_type.value,
+        "scheduled_for": iso,
+        "summary_path": summary_path,
+        "created_at": datetime.now().isoformat(timespec="microseconds"),
+    }
 
 
 def get_due_quizzes(state: dict) -> list[dict]:
@@ -203,15 +398,16 @@ def get_due_quizzes(state: dict) -> list[dict]:
     Returns:
         List of due quiz dicts
     """
-    now = datetime.now()
-    due = []
+    # ISO-8601 timestamps sort chronologically, so one isoformat() up
+    # front turns the check into plain string compares with no per-quiz
+    # datetime parsing. add_pending_quiz keeps the list sorted by
+    # scheduled_for, so the due quizzes are exactly the prefix up to the
+    # first not-yet-due entry.
+    now_iso = datetime.now().isoformat()
+    pending = state.get("pending_quizzes", [])
 
-    for quiz in state.get("pending_quizzes", []):
-        scheduled_for = datetime.fromisoformat(quiz["scheduled_for"])
-        if scheduled_for <= now:
-            due.append(quiz)
-
-    return due
+    idx = bisect.bisect_right(pending, now_iso, key=lambda q: q["scheduled_for"])
+    return pending[:idx]
 
 
 def add_pending_quiz(state: dict, schedule: QuizSchedule) -> dict:
@@ -224,7 +420,10 @@ def add_pending_quiz(state: dict, schedule: QuizSchedule) -> dict:
     Returns:
         Updated state
     """
-    state["pending_quizzes"].append(schedule.to_dict())
+    # Insert in scheduled_for order so get_due_quizzes can stop at the
+    # first not-yet-due quiz
+    bisect.insort(state["pending_quizzes"], schedule.to_dict(),
+                  key=lambda q: q["scheduled_for"])
     return state
 
 
@@ -255,24 +454,79 @@ def mark_quiz_completed(state: dict, session_id: str, result: dict) -> dict:
     return state
 
 
+def record_pending_quiz(project_path: Path, schedule) -> None:
+    """Journal a newly scheduled quiz without rewriting the snapshot.
+
+    Args:
+        project_path: Path to the project directory
+        schedule: QuizSchedule, or its dict form from schedule_quiz_dict
+    """
+    quiz = schedule if isinstance(schedule, dict) else schedule.to_dict()
+    _append_state_op(project_path, {"op": "add", "quiz": quiz})
+
+
+def record_quiz_completed(project_path: Path, session_id: str, result: dict) -> None:
+    """Journal a quiz completion without rewriting the snapshot.
+
+    Args:
+        project_path: Path to the project directory
+        session_id: Session ID of completed quiz
+        result: Quiz result dict
+    """
+    _append_state_op(project_path, {
+        "op": "complete",
+        "session_id": session_id,
+        "completed_at": datetime.now().isoformat(),
+        "result": result,
+    })
+
+
+def _applescript_quote(text: str) -> str:
+    """Escape a string for interpolation into an AppleScript literal."""
+    return text.replace("\\", "\\\\").replace('"', '\\"')
+
+
+# Resolved once per process so each notification skips the PATH walk.
+# terminal-notifier is preferred: a single native exec, no AppleScript
+# compilation (~80 ms cold for osascript).
+_TERMINAL_NOTIFIER = shutil.which("terminal-notifier")
+_OSASCRIPT = None if _TERMINAL_NOTIFIER else shutil.which("osascript")
+
+
 def send_notification(title: str, message: str) -> None:
-    """Send a macOS notification.
+    """Send a macOS notification without waiting for it.
+
+    The notifier process is detached and never joined, so the hook
+    returns immediately instead of blocking on notification delivery.
 
     Args:
         title: Notification title
         message: Notification body
     """
+    # Deferred: hooks that never notify (SessionStart reminder, list)
+    # skip loading subprocess entirely
+    import subprocess
+
+    if _TERMINAL_NOTIFIER:
+        cmd = [_TERMINAL_NOTIFIER, "-title", title, "-message", message]
+    elif _OSASCRIPT:
+        script = (
+            f'display notification "{_applescript_quote(message)}" '
+            f'with title "{_applescript_quote(title)}"'
+        )
+        cmd = [_OSASCRIPT, "-e", script]
+    else:
+        return  # No notifier available on this machine
+
     try:
-        # Use osascript for macOS notifications
-        script = f'''
-        display notification "{message}" with title "{title}"
-        '''
-        subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
-            timeout=5
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
-    except (subprocess.TimeoutExpired, FileNotFoundError):
+    except OSError:
         pass  # Silent fail on notification errors
 
 
@@ -285,7 +539,7 @@ def check_and_notify_due_quizzes(project_path: Path) -> list[dict]:
     Returns:
         List of due quizzes
     """
-    state = load_quiz_state(project_path)
+    state = load_quiz_state_ro(project_path)
     due = get_due_quizzes(state)
 
     if due:
@@ -305,7 +559,7 @@ def print_pending_reminder(project_path: Path) -> None:
     Args:
         project_path: Path to the project directory
     """
-    state = load_quiz_state(project_path)
+    state = load_quiz_state_ro(project_path)
     due = get_due_quizzes(state)
 
     if due:
@@ -315,8 +569,50 @@ def print_pending_reminder(project_path: Path) -> None:
         print("╰─────────────────────────────────────────────────────────────╯\n")
 
 
+def _fast_path_project(argv: list[str]) -> Optional[Path]:
+    """Resolve the project path for trivially-shaped command lines.
+
+    Handles ``<cmd>`` and ``<cmd> -p/--project PATH``. Returns None for
+    anything else, signalling main() to fall back to argparse.
+    """
+    if len(argv) == 1:
+        return Path.cwd()
+    if len(argv) == 3 and argv[1] in ("-p", "--project"):
+        return Path(argv[2])
+    return None
+
+
 def main():
     """Main entry point for scheduler operations."""
+    # The check/notify/list paths run from shell hooks on every terminal
+    # open, where argparse's import and parser construction dominate
+    # wall-clock. Dispatch the common fixed shapes on raw sys.argv and
+    # only build the full parser for anything more involved.
+    argv = sys.argv[1:]
+    if argv and argv[0] in ("check", "notify", "list"):
+        project = _fast_path_project(argv)
+        if project is not None:
+            if argv[0] == "check":
+                due = check_and_notify_due_quizzes(project)
+                if due:
+                    print(f"Due quizzes: {len(due)}")
+                    for q in due:
+                        print(f"  - Session {q['session_id'][:8]} ({q['type']})")
+                else:
+                    print("No quizzes due")
+            elif argv[0] == "notify":
+                print_pending_reminder(project)
+            else:
+                state = load_quiz_state_ro(project)
+                pending = state.get("pending_quizzes", [])
+                if pending:
+                    print(f"Pending quizzes ({len(pending)}):")
+                    for q in pending:
+                        print(f"  - {q['session_id'][:8]}: {q['type']} at {q['scheduled_for']}")
+                else:
+                    print("No pending quizzes")
+            return
+
     import argparse
 
     parser = argparse.ArgumentParser(description="Quiz scheduler operations")
@@ -345,18 +641,16 @@ def main():
             print("--session-id, --type, and --summary are required for add")
             sys.exit(1)
 
-        state = load_quiz_state(args.project)
-        schedule = schedule_quiz(
+        quiz = schedule_quiz_dict(
             session_id=args.session_id,
             schedule_type=ScheduleType(args.type),
             summary_path=str(args.summary),
         )
-        state = add_pending_quiz(state, schedule)
-        save_quiz_state(args.project, state)
-        print(f"Scheduled {args.type} quiz for {schedule.scheduled_for}")
+        record_pending_quiz(args.project, quiz)
+        print(f"Scheduled {args.type} quiz for {quiz['scheduled_for']}")
 
     elif args.command == "list":
-        state = load_quiz_state(args.project)
+        state = load_quiz_state_ro(args.project)
         pending = state.get("pending_quizzes", [])
         if pending:
             print(f"Pending quizzes ({len(pending)}):")
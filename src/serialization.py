@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Shared JSON byte helpers for the Learning Quiz Hook.
+
+Machine-consumed files (session logs, quiz results) are written as
+compact JSON bytes. orjson is used when installed - roughly 4x faster
+to encode and decode - with stdlib json as the fallback, so the hook
+keeps working with no dependencies installed.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional accelerator - stdlib json works fine
+    orjson = None
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads_bytes(buf: "bytes | str") -> Any:
+    """Parse JSON from bytes or str. Raises ValueError on bad input."""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
@@ -10,30 +10,175 @@ SessionEnd hook that generates a learning summary including:
 This summary is used by the quiz generator to create relevant questions.
 """
 import json
+import os
 import re
 import sys
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator - stdlib json works fine
+    orjson = None
+
+from activity_collector import load_session
+
+
+def _loads(raw):
+    """Parse a JSON document with the fastest available parser."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Translation table for decoding dash-encoded project paths
+_DASH_TO_SLASH = str.maketrans({"-": "/"})
+
+
+def _union(patterns: list[str]) -> re.Pattern:
+    """Fuse a pattern list into one compiled case-insensitive alternation.
+
+    One search over the fused pattern replaces a Python-level loop of
+    per-pattern searches, and compilation happens once at import.
+    """
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Path fragments indicating architectural components. All fixed
+# literals, so a substring scan over the lowered path beats the regex
+# engine; singular and plural forms are spelled out
+_ARCH_LITERALS = (
+    "/service/", "/services/",
+    "/handler/", "/handlers/",
+    "/controller/", "/controllers/",
+    "/middleware/",
+    "/api/",
+    "/route/", "/routes/",
+    "/model/", "/models/",
+    "/repository/", "/repositories/",
+    "/adapter/", "/adapters/",
+)
+
+# Architectural components live in source files; writes to docs,
+# lockfiles, images etc. are skipped before any pattern matching.
+# str.endswith on a tuple is a single C-level suffix check.
+_SRC_EXTS = (
+    ".py", ".ts", ".js", ".tsx", ".jsx", ".go", ".rs", ".java",
+    ".rb", ".cs", ".cpp", ".c", ".h", ".hpp",
+)
+
+_COMPONENT_TYPE_RE = re.compile(
+    r"/(services?|handlers?|controllers?|middleware|api|routes?|models?)/",
+    re.IGNORECASE,
+)
+_CLASS_RE = re.compile(r"class\s+(\w+)")
+_FUNC_RE = re.compile(r"def\s+(\w+)")
+
+# Debugging indicators split by shape: bare literals get a substring
+# scan over the lowered text; only patterns with real metacharacters
+# keep the regex engine (kubectl/docker logs fall under \blogs?\b)
+_DEBUG_LITERALS = (
+    "debug",               # DEBUG=true, etc
+    "trace",               # also covers strace
+    "inspect",
+    "journalctl",
+    "tcpdump",
+)
+_DEBUG_RE = _union([
+    r"\blogs?\b",           # log, logs
+    r"tail\s+-f",
+    r"curl\s+.*-v",        # verbose curl
+])
+
+# Commands that are NOT debugging
+_EXCLUDE_RE = _union([
+    r"^npm\s+(install|i|ci)\b",
+    r"^pip\s+install",
+    r"^yarn\s+(add|install)",
+    r"^git\s+(add|commit|push|pull)",
+    r"^mkdir",
+    r"^rm\s",
+    r"^cp\s",
+    r"^mv\s",
+])
+
+# Phrases indicating failure mode discussion
+_FAILURE_RE = _union([
+    r"(if|when)\s+\w+\s+(fails?|goes?\s+down|is\s+slow|is\s+unavailable|times?\s+out)",
+    r"(tradeoff|trade-off|trade off)",
+    r"(retry|fallback|circuit.?breaker)",
+    r"(cascading|failure|error).*(handling|recovery)",
+    r"what\s+happens\s+(if|when)",
+    r"(handle|catch).*(error|exception)",
+])
+
+# Cheap lowercase substrings that every _EXPLANATION_RE match contains;
+# transcript lines without any of them can skip JSON parsing entirely
+_EXPLANATION_LITERALS = (
+    "because", "trade", "instead of", "the reason",
+    "this allow", "this enable", "this ensure", "so that", "in order to",
+)
+
+# Phrases indicating explanations worth capturing
+_EXPLANATION_RE = _union([
+    r"\bbecause\b",
+    r"\b(tradeoff|trade-off|trade off)\b",
+    r"\binstead of\b",
+    r"\bthe reason\b",
+    r"\bthis (allows?|enables?|ensures?)\b",
+    r"\bso that\b",
+    r"\bin order to\b",
+])
+
+def _matching_sentences(pattern: re.Pattern, text: str):
+    """Yield the sentence enclosing each match of pattern in text.
+
+    One finditer pass over the whole text replaces splitting it into
+    sentences and re-running the search on every piece; each enclosing
+    sentence is recovered by scanning outward from the match to the
+    nearest terminators.
+
+    Args:
+        pattern: Compiled pattern to locate
+        text: Text to scan
+
+    Yields:
+        Stripped sentences containing a match, possibly with repeats
+    """
+    for match in pattern.finditer(text):
+        start = max(text.rfind(c, 0, match.start()) for c in ".!?\n")
+        ends = [e for e in (text.find(c, match.end()) for c in ".!?") if e != -1]
+        end = min(ends, default=len(text) - 1)
+        yield text[start + 1:end + 1].strip()
+
 
 def load_session_activities(session_file: Path) -> list[dict]:
     """Load activities from a session log file.
 
+    Supports both the current JSONL format (one event per line, with a
+    header line carrying session metadata) and the legacy single-JSON
+    format with an "events" array.
+
     Args:
-        session_file: Path to the session JSON file
+        session_file: Path to the session log file
 
     Returns:
-        List of activity events, empty if file doesn't exist
+        List of activity events, empty if file doesn't exist. JSONL logs
+        are served from the collector's per-process cache - treat the
+        result as read-only.
     """
-    if not session_file.exists():
-        return []
+    if session_file.suffix == ".jsonl":
+        return load_session(session_file)
 
+    # EAFP: let open() raise for missing files rather than paying a
+    # separate exists() stat on every call
     try:
         with open(session_file) as f:
             data = json.load(f)
         return data.get("events", [])
-    except (json.JSONDecodeError, IOError):
+    except (json.JSONDecodeError, OSError):
         return []
 
 
@@ -53,57 +198,43 @@ def extract_architectural_decisions(activities: list[dict]) -> list[str]:
     """
     decisions = []
 
-    # Patterns indicating architectural components
-    arch_patterns = [
-        r"/services?/",
-        r"/handlers?/",
-        r"/controllers?/",
-        r"/middleware/",
-        r"/api/",
-        r"/routes?/",
-        r"/models?/",
-        r"/repositories?/",
-        r"/adapters?/",
-    ]
-
     for activity in activities:
         if activity.get("event_type") != "file_write":
             continue
 
         file_path = activity.get("file_path", "")
+        path_l = file_path.lower()
 
-        # Skip test files
-        if "/test" in file_path.lower() or "test_" in file_path.lower():
+        # Skip non-source and test files
+        if not path_l.endswith(_SRC_EXTS):
+            continue
+        if "/test" in path_l or "test_" in path_l:
             continue
 
         # Check if path matches architectural patterns
-        for pattern in arch_patterns:
-            if re.search(pattern, file_path, re.IGNORECASE):
-                # Extract component name from path
-                parts = file_path.split("/")
-                filename = parts[-1] if parts else "unknown"
-                component_type = None
-
-                for part in parts:
-                    if re.match(r"(services?|handlers?|controllers?|middleware|api|routes?|models?)", part, re.IGNORECASE):
-                        component_type = part.rstrip("s")
-                        break
-
-                decision = f"Created {component_type or 'component'}: {filename}"
-
-                # Add context if available
-                preview = activity.get("context", {}).get("content_preview", "")
-                if preview:
-                    # Try to extract class/function name
-                    class_match = re.search(r"class\s+(\w+)", preview)
-                    func_match = re.search(r"def\s+(\w+)", preview)
-                    if class_match:
-                        decision = f"Created {component_type or 'class'} {class_match.group(1)} in {filename}"
-                    elif func_match:
-                        decision = f"Created {component_type or 'function'} {func_match.group(1)} in {filename}"
-
-                decisions.append(decision)
-                break
+        if not any(lit in path_l for lit in _ARCH_LITERALS):
+            continue
+
+        # Extract component name from path. One anchored search over the
+        # whole path replaces a per-part re.match loop
+        filename = file_path.rsplit("/", 1)[-1] or "unknown"
+        m = _COMPONENT_TYPE_RE.search(file_path)
+        component_type = m.group(1).rstrip("s") if m else None
+
+        decision = f"Created {component_type or 'component'}: {filename}"
+
+        # Add context if available
+        preview = activity.get("context", {}).get("content_preview", "")
+        if preview:
+            # Try to extract class/function name
+            class_match = _CLASS_RE.search(preview)
+            func_match = _FUNC_RE.search(preview)
+            if class_match:
+                decision = f"Created {component_type or 'class'} {class_match.group(1)} in {filename}"
+            elif func_match:
+                decision = f"Created {component_type or 'function'} {func_match.group(1)} in {filename}"
+
+        decisions.append(decision)
 
     return decisions
 
@@ -124,33 +255,6 @@ def extract_debugging_steps(activities: list[dict]) -> list[dict]:
     """
     steps = []
 
-    # Patterns indicating debugging activity
-    debug_patterns = [
-        r"\blogs?\b",           # log, logs
-        r"debug",               # DEBUG=true, etc
-        r"trace",
-        r"inspect",
-        r"tail\s+-f",
-        r"kubectl\s+logs",
-        r"docker\s+logs",
-        r"journalctl",
-        r"strace",
-        r"tcpdump",
-        r"curl\s+.*-v",        # verbose curl
-    ]
-
-    # Commands that are NOT debugging
-    exclude_patterns = [
-        r"^npm\s+(install|i|ci)\b",
-        r"^pip\s+install",
-        r"^yarn\s+(add|install)",
-        r"^git\s+(add|commit|push|pull)",
-        r"^mkdir",
-        r"^rm\s",
-        r"^cp\s",
-        r"^mv\s",
-    ]
-
     for activity in activities:
         if activity.get("event_type") != "command":
             continue
@@ -159,12 +263,19 @@ def extract_debugging_steps(activities: list[dict]) -> list[dict]:
         description = activity.get("description", "")
 
         # Skip excluded commands
-        if any(re.search(p, command, re.IGNORECASE) for p in exclude_patterns):
+        if _EXCLUDE_RE.search(command):
             continue
 
-        # Check if it matches debugging patterns
-        is_debug = any(re.search(p, command, re.IGNORECASE) for p in debug_patterns)
-        is_debug = is_debug or any(re.search(p, description, re.IGNORECASE) for p in debug_patterns)
+        # Check if it matches debugging patterns: cheap substring scan
+        # over the lowered text first, regex only for the rest
+        cmd_l = command.lower()
+        desc_l = description.lower()
+        is_debug = (
+            any(lit in cmd_l for lit in _DEBUG_LITERALS)
+            or any(lit in desc_l for lit in _DEBUG_LITERALS)
+            or _DEBUG_RE.search(command)
+            or _DEBUG_RE.search(description)
+        )
 
         if is_debug:
             steps.append({
@@ -192,27 +303,12 @@ def extract_failure_modes(explanations: list[str]) -> list[str]:
     """
     failures = []
 
-    # Patterns indicating failure mode discussion
-    failure_patterns = [
-        r"(if|when)\s+\w+\s+(fails?|goes?\s+down|is\s+slow|is\s+unavailable|times?\s+out)",
-        r"(tradeoff|trade-off|trade off)",
-        r"(retry|fallback|circuit.?breaker)",
-        r"(cascading|failure|error).*(handling|recovery)",
-        r"what\s+happens\s+(if|when)",
-        r"(handle|catch).*(error|exception)",
-    ]
-
+    seen = set()
     for explanation in explanations:
-        for pattern in failure_patterns:
-            if re.search(pattern, explanation, re.IGNORECASE):
-                # Extract the relevant sentence
-                sentences = re.split(r'[.!?]+', explanation)
-                for sentence in sentences:
-                    if re.search(pattern, sentence, re.IGNORECASE):
-                        cleaned = sentence.strip()
-                        if cleaned and cleaned not in failures:
-                            failures.append(cleaned)
-                break
+        for cleaned in _matching_sentences(_FAILURE_RE, explanation):
+            if cleaned and cleaned not in seen:
+                seen.add(cleaned)
+                failures.append(cleaned)
 
     return failures
 
@@ -234,25 +330,30 @@ def parse_transcript_for_explanations(transcript_path: Path) -> list[str]:
     if not transcript_path.exists():
         return []
 
+    # generate_summary keeps at most 10 explanations; capping here a
+    # little above that bounds memory on large transcripts and lets the
+    # walk stop early instead of scanning to EOF
+    max_explanations = 32
     explanations = []
-
-    # Patterns indicating explanations worth capturing
-    explanation_patterns = [
-        r"\bbecause\b",
-        r"\b(tradeoff|trade-off|trade off)\b",
-        r"\binstead of\b",
-        r"\bthe reason\b",
-        r"\bthis (allows?|enables?|ensures?)\b",
-        r"\bso that\b",
-        r"\bin order to\b",
-    ]
+    seen = set()
 
     try:
         with open(transcript_path) as f:
             for line in f:
+                # Cheap substring prefilter: user/system/tool entries
+                # never survive the role check, so skip parsing them
+                if '"assistant"' not in line:
+                    continue
+
+                # Second prefilter: a line with no trigger phrase can't
+                # yield an explanation, so don't bother parsing it
+                line_l = line.lower()
+                if not any(lit in line_l for lit in _EXPLANATION_LITERALS):
+                    continue
+
                 try:
-                    entry = json.loads(line.strip())
-                except json.JSONDecodeError:
+                    entry = _loads(line)
+                except ValueError:
                     continue
 
                 # Only look at assistant messages
@@ -263,17 +364,13 @@ def parse_transcript_for_explanations(transcript_path: Path) -> list[str]:
                 if not content:
                     continue
 
-                # Check for explanation patterns
-                for pattern in explanation_patterns:
-                    if re.search(pattern, content, re.IGNORECASE):
-                        # Extract relevant sentences
-                        sentences = re.split(r'(?<=[.!?])\s+', content)
-                        for sentence in sentences:
-                            if re.search(pattern, sentence, re.IGNORECASE):
-                                cleaned = sentence.strip()
-                                if len(cleaned) > 20 and cleaned not in explanations:
-                                    explanations.append(cleaned)
-                        break
+                # Extract sentences containing explanation patterns
+                for cleaned in _matching_sentences(_EXPLANATION_RE, content):
+                    if len(cleaned) > 20 and cleaned not in seen:
+                        seen.add(cleaned)
+                        explanations.append(cleaned)
+                        if len(explanations) >= max_explanations:
+                            return explanations
 
     except IOError:
         return []
@@ -298,8 +395,21 @@ def generate_summary(
     Returns:
         Complete summary dict
     """
-    architectural_decisions = extract_architectural_decisions(activities)
-    debugging_steps = extract_debugging_steps(activities)
+    # One pass over the activities for the stats counts and the
+    # per-extractor slices, instead of each consumer re-walking the list
+    counts: Counter = Counter()
+    file_writes = []
+    commands = []
+    for activity in activities:
+        event_type = activity.get("event_type")
+        counts[event_type] += 1
+        if event_type == "file_write":
+            file_writes.append(activity)
+        elif event_type == "command":
+            commands.append(activity)
+
+    architectural_decisions = extract_architectural_decisions(file_writes)
+    debugging_steps = extract_debugging_steps(commands)
     failure_modes = extract_failure_modes(explanations)
 
     # Determine quiz schedule based on session length and content
@@ -310,19 +420,20 @@ def generate_summary(
         len(failure_modes) >= 2
     )
 
+    now = datetime.now()
     if duration_minutes >= 30 and has_substantial_content:
         quiz_type = "same_day"
         # Schedule for 4 hours later or evening, whichever is sooner
-        scheduled_time = datetime.now() + timedelta(hours=4)
+        scheduled_time = now + timedelta(hours=4)
     else:
         quiz_type = "next_day"
         # Schedule for 9am next day
-        tomorrow = datetime.now() + timedelta(days=1)
+        tomorrow = now + timedelta(days=1)
         scheduled_time = tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
 
     return {
         "session_id": session_id,
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": now.isoformat(),
         "duration_minutes": duration_minutes,
         "architectural_decisions": architectural_decisions,
         "debugging_steps": debugging_steps,
@@ -334,9 +445,9 @@ def generate_summary(
         },
         "stats": {
             "total_activities": len(activities),
-            "file_writes": sum(1 for a in activities if a.get("event_type") == "file_write"),
-            "file_edits": sum(1 for a in activities if a.get("event_type") == "file_edit"),
-            "commands": sum(1 for a in activities if a.get("event_type") == "command"),
+            "file_writes": counts["file_write"],
+            "file_edits": counts["file_edit"],
+            "commands": counts["command"],
         }
     }
 
@@ -351,21 +462,29 @@ def find_session_file(project_path: Path, session_id: str) -> Optional[Path]:
     Returns:
         Path to session file or None
     """
-    sessions_dir = project_path / ".claude" / "sessions"
-    if not sessions_dir.exists():
-        return None
+    sessions_dir = os.path.join(str(project_path), ".claude", "sessions")
+    prefix = session_id[:8]
+    today = datetime.now().strftime("%Y-%m-%d")
+    today_name = None
 
-    # Look for file matching session ID
-    for session_file in sessions_dir.glob("*.json"):
-        if session_id[:8] in session_file.name:
-            return session_file
+    # One listdir pass covers both lookups: exact session-ID match wins,
+    # a file from today is kept as fallback (.jsonl current, .json
+    # legacy). Plain name strings throughout; a Path is only built for
+    # the file actually returned.
+    try:
+        names = os.listdir(sessions_dir)
+    except OSError:
+        return None
 
-    # Also check by date (today's sessions)
-    today = datetime.now().strftime("%Y-%m-%d")
-    for session_file in sessions_dir.glob(f"{today}*.json"):
-        return session_file
+    for name in names:
+        if ".json" not in name:
+            continue
+        if prefix in name:
+            return Path(sessions_dir, name)
+        if today_name is None and name.startswith(today):
+            today_name = name
 
-    return None
+    return Path(sessions_dir, today_name) if today_name else None
 
 
 def save_summary(summary: dict, project_path: Path) -> Path:
@@ -385,8 +504,11 @@ def save_summary(summary: dict, project_path: Path) -> Path:
     date_str = datetime.now().strftime("%Y-%m-%d")
     summary_path = summaries_dir / f"{date_str}-{session_id[:8]}-summary.json"
 
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    if orjson is not None:
+        summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        with open(summary_path, "w") as f:
+            json.dump(summary, f, indent=2)
 
     return summary_path
 
@@ -412,7 +534,7 @@ def main():
         parts = transcript_path.split(".claude/projects/")
         if len(parts) > 1:
             encoded = parts[1].split("/")[0]
-            decoded = "/" + encoded.replace("-", "/")
+            decoded = "/" + encoded.translate(_DASH_TO_SLASH)
             project_path = Path(decoded)
 
     # Find and load session activities
@@ -15,8 +15,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from activity_collector import (
     extract_learning_event,
     get_session_log_path,
+    load_session,
     log_activity,
+    log_activity_batch,
     parse_hook_input,
+    send_to_daemon,
 )
 
 
@@ -38,6 +41,62 @@ class TestParseHookInput:
         assert result["tool_name"] == "Write"
         assert result["session_id"] == "abc123"
 
+    def test_parses_bytes_input(self):
+        hook_input = {"tool_name": "Bash", "session_id": "abc123"}
+        result = parse_hook_input(json.dumps(hook_input).encode())
+        assert result["tool_name"] == "Bash"
+
+    def test_truncates_huge_content_fields(self):
+        hook_input = {
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": "/project/big.txt",
+                "content": "x" * 100_000
+            },
+            "session_id": "abc123"
+        }
+        result = parse_hook_input(json.dumps(hook_input).encode())
+
+        # Surrounding fields survive, oversized value is cut short
+        assert result["tool_name"] == "Write"
+        assert result["tool_input"]["file_path"] == "/project/big.txt"
+        content = result["tool_input"]["content"]
+        assert content.startswith("x")
+        # Still long enough for the 500-char preview, far below original
+        assert 500 <= len(content) < 100_000
+
+    def test_truncation_preserves_escapes(self):
+        hook_input = {
+            "tool_name": "Write",
+            "tool_input": {
+                "file_path": "/project/code.py",
+                "content": 'line with "quotes" and \\ slashes\n' * 5_000
+            },
+            "session_id": "abc123"
+        }
+        result = parse_hook_input(json.dumps(hook_input).encode())
+
+        assert result is not None
+        assert result["session_id"] == "abc123"
+
+    def test_truncation_keeps_surrogate_pairs_intact(self):
+        # json.dumps escapes the emoji to a \\ud83d\\ude00 pair; a cut landing
+        # between the halves leaves a lone high surrogate, which orjson
+        # rejects. Sweep paddings so the pair straddles the cut point.
+        for pad in range(4088, 4100):
+            hook_input = {
+                "tool_name": "Write",
+                "tool_input": {
+                    "file_path": "/project/emoji.txt",
+                    "content": "x" * pad + "\U0001F600" + "y" * 30_000
+                },
+                "session_id": "abc123"
+            }
+            result = parse_hook_input(json.dumps(hook_input).encode())
+
+            assert result is not None, f"pad={pad}"
+            assert result["tool_input"]["content"].startswith("x")
+
     def test_returns_none_for_invalid_json(self):
         result = parse_hook_input("not valid json")
         assert result is None
@@ -145,7 +204,7 @@ class TestGetSessionLogPath:
 
             assert result.parent == project_path / ".claude" / "sessions"
             assert "abc123" in result.name
-            assert result.suffix == ".json"
+            assert result.suffix == ".jsonl"
 
     def test_extracts_project_from_transcript_path(self):
         transcript_path = "/Users/sam/.claude/projects/-Users-sam-myproject/abc123.jsonl"
@@ -158,9 +217,13 @@ class TestGetSessionLogPath:
 class TestLogActivity:
     """Tests for logging activity to session file."""
 
-    def test_creates_new_session_file(self):
+    def _read_lines(self, log_path):
+        with open(log_path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def test_creates_new_session_file_with_header(self):
         with tempfile.TemporaryDirectory() as tmpdir:
-            log_path = Path(tmpdir) / ".claude" / "sessions" / "test-session.json"
+            log_path = Path(tmpdir) / ".claude" / "sessions" / "test-session.jsonl"
 
             event = {
                 "timestamp": "2026-01-30T10:30:00",
@@ -172,25 +235,24 @@ class TestLogActivity:
             log_activity(event, log_path)
 
             assert log_path.exists()
-            with open(log_path) as f:
-                data = json.load(f)
-            assert len(data["events"]) == 1
-            assert data["events"][0]["event_type"] == "file_write"
+            lines = self._read_lines(log_path)
+            # Header line plus one event line
+            assert len(lines) == 2
+            assert lines[0]["session_id"] == "test123"
+            assert "started" in lines[0]
+            assert lines[1]["event_type"] == "file_write"
 
     def test_appends_to_existing_session_file(self):
         with tempfile.TemporaryDirectory() as tmpdir:
-            log_path = Path(tmpdir) / "session.json"
+            log_path = Path(tmpdir) / "session.jsonl"
+            log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Create existing file
-            existing_data = {
+            first_event = {
+                "timestamp": "2026-01-30T10:30:00",
                 "session_id": "test123",
-                "events": [{"event_type": "file_write", "file_path": "/a.py"}]
+                "event_type": "file_write",
+                "file_path": "/a.py"
             }
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(log_path, "w") as f:
-                json.dump(existing_data, f)
-
-            # Add new event
             new_event = {
                 "timestamp": "2026-01-30T10:35:00",
                 "session_id": "test123",
@@ -198,22 +260,21 @@ class TestLogActivity:
                 "file_path": "/b.py"
             }
 
+            log_activity(first_event, log_path)
             log_activity(new_event, log_path)
 
-            with open(log_path) as f:
-                data = json.load(f)
-            assert len(data["events"]) == 2
+            lines = self._read_lines(log_path)
+            # One header plus two events - header written only once
+            assert len(lines) == 3
+            events = [l for l in lines if "event_type" in l]
+            assert len(events) == 2
 
     def test_handles_concurrent_writes_safely(self):
         """Ensure file locking prevents corruption."""
         with tempfile.TemporaryDirectory() as tmpdir:
-            log_path = Path(tmpdir) / "session.json"
+            log_path = Path(tmpdir) / "session.jsonl"
             log_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Initialize file
-            with open(log_path, "w") as f:
-                json.dump({"session_id": "test", "events": []}, f)
-
             # Simulate multiple rapid writes
             for i in range(10):
                 event = {
@@ -224,7 +285,73 @@ class TestLogActivity:
                 }
                 log_activity(event, log_path)
 
-            # Verify all events logged correctly
-            with open(log_path) as f:
-                data = json.load(f)
-            assert len(data["events"]) == 10
+            # Verify all events logged correctly (every line valid JSON)
+            lines = self._read_lines(log_path)
+            events = [l for l in lines if "event_type" in l]
+            assert len(events) == 10
+
+    def test_batch_appends_all_events_with_single_header(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "session.jsonl"
+
+            events = [
+                {
+                    "timestamp": f"2026-01-30T10:{i:02d}:00",
+                    "session_id": "test",
+                    "event_type": "command",
+                    "command": f"cmd{i}"
+                }
+                for i in range(5)
+            ]
+
+            log_activity_batch(events, log_path)
+
+            lines = self._read_lines(log_path)
+            assert len(lines) == 6  # header + 5 events
+            assert "started" in lines[0]
+
+
+class TestLoadSession:
+    """Tests for reading events back out of a session log."""
+
+    def test_skips_header_and_torn_lines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "session.jsonl"
+            log_path.write_text(
+                '{"session_id": "test", "started": 1}\n'
+                '{"event_type": "command", "session_id": "test", "command": "make"}\n'
+                '{"event_type": "file_wri'  # torn mid-write
+            )
+
+            events = load_session(log_path)
+
+            assert len(events) == 1
+            assert events[0]["command"] == "make"
+
+    def test_caches_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "session.jsonl"
+
+            log_activity({"session_id": "test", "event_type": "command",
+                          "command": "cmd0"}, log_path)
+            first = load_session(log_path)
+            # Unchanged file is served from the cache
+            assert load_session(log_path) is first
+
+            log_activity({"session_id": "test", "event_type": "command",
+                          "command": "cmd1"}, log_path)
+            assert len(load_session(log_path)) == 2
+
+    def test_missing_file_returns_empty(self):
+        assert load_session(Path("/nonexistent/session.jsonl")) == []
+
+
+class TestSendToDaemon:
+    """Tests for handing events off to the batching daemon."""
+
+    def test_returns_false_when_no_daemon_running(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "session.jsonl"
+            event = {"event_type": "command", "command": "ls -la"}
+
+            assert send_to_daemon(event, log_path) is False
@@ -24,7 +24,7 @@ from scheduler import (
     save_quiz_state,
     schedule_quiz,
 )
-from quiz_runner import process_answer, process_skip, save_quiz_result, QuizResult, SkipReason
+from quiz_runner import process_answer, process_skip, save_quiz_result, QuizResult, TIME_PRESSURE
 from results_tracker import (
     calculate_topic_scores,
     generate_blind_spot_report,
@@ -135,7 +135,7 @@ class TestEndToEndFlow:
             # Skip second question
             result = process_skip(
                 question={"type": "counterfactual", "tags": ["failure"]},
-                reason=SkipReason.TIME_PRESSURE
+                reason=TIME_PRESSURE
             )
             results.append(result)
 
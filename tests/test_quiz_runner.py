@@ -11,8 +11,10 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from quiz_runner import (
+    ALREADY_KNOW,
+    OTHER,
+    TIME_PRESSURE,
     QuizResult,
-    SkipReason,
     format_question_display,
     load_quiz,
     process_answer,
@@ -160,11 +162,11 @@ class TestProcessSkip:
 
         result = process_skip(
             question=question,
-            reason=SkipReason.TIME_PRESSURE
+            reason=TIME_PRESSURE
         )
 
         assert result.skipped is True
-        assert result.skip_reason == SkipReason.TIME_PRESSURE
+        assert result.skip_reason == TIME_PRESSURE
 
     def test_records_skip_with_custom_note(self):
         question = {
@@ -175,7 +177,7 @@ class TestProcessSkip:
 
         result = process_skip(
             question=question,
-            reason=SkipReason.OTHER,
+            reason=OTHER,
             skip_note="Need to look this up later"
         )
 
@@ -201,7 +203,7 @@ class TestSaveQuizResult:
                     tags=["failure"],
                     correct=False,
                     skipped=True,
-                    skip_reason=SkipReason.TIME_PRESSURE,
+                    skip_reason=TIME_PRESSURE,
                     time_seconds=5
                 )
             ]
@@ -246,7 +248,7 @@ class TestQuizResultDataclass:
             tags=[],
             correct=False,
             skipped=True,
-            skip_reason=SkipReason.ALREADY_KNOW,
+            skip_reason=ALREADY_KNOW,
             time_seconds=3
         )
 
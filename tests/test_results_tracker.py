@@ -15,8 +15,11 @@ from results_tracker import (
     calculate_topic_scores,
     generate_blind_spot_report,
     get_skip_patterns,
+    iter_results,
     load_all_results,
     merge_result_into_state,
+    scan_project,
+    scan_results,
 )
 
 
@@ -49,6 +52,107 @@ class TestLoadAllResults:
             assert results == []
 
 
+class TestIterResults:
+    """Tests for the streaming results reader."""
+
+    def test_yields_in_filename_order_skipping_corrupt_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results_dir = Path(tmpdir) / ".claude" / "quiz-results"
+            results_dir.mkdir(parents=True)
+
+            for i in range(3):
+                with open(results_dir / f"result{i}.json", "w") as f:
+                    json.dump({"session_id": f"session{i}"}, f)
+            (results_dir / "result1.json").write_text("not valid json")
+
+            sessions = [r["session_id"] for r in iter_results(Path(tmpdir))]
+            assert sessions == ["session0", "session2"]
+
+    def test_feeds_scan_results(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results_dir = Path(tmpdir) / ".claude" / "quiz-results"
+            results_dir.mkdir(parents=True)
+
+            result = {
+                "session_id": "session0",
+                "summary": {"total": 2, "correct": 1, "skipped": 0},
+                "skip_reasons": {},
+                "questions": [
+                    {"type": "system_design", "correct": True, "tags": ["api"]},
+                    {"type": "debugging", "correct": False, "tags": []},
+                ],
+            }
+            with open(results_dir / "result0.json", "w") as f:
+                json.dump(result, f)
+
+            # The generator streams straight into the fused scan
+            topic_scores, _, aggregate = scan_results(iter_results(Path(tmpdir)))
+            assert topic_scores["system_design"] == {"correct": 1, "total": 1}
+            assert aggregate["total_quizzes"] == 1
+            assert aggregate["total_questions"] == 2
+
+    def test_empty_project_yields_nothing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            assert list(iter_results(Path(tmpdir))) == []
+
+
+class TestScanProject:
+    """Tests for the cached project-wide scan."""
+
+    def _write_result(self, results_dir, name, correct):
+        result = {
+            "session_id": name,
+            "summary": {"total": 1, "correct": int(correct), "skipped": 0},
+            "skip_reasons": {},
+            "questions": [
+                {"type": "system_design", "correct": correct, "tags": ["caching"]}
+            ],
+        }
+        with open(results_dir / f"{name}.json", "w") as f:
+            json.dump(result, f)
+
+    def test_matches_uncached_scan(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results_dir = Path(tmpdir) / ".claude" / "quiz-results"
+            results_dir.mkdir(parents=True)
+            self._write_result(results_dir, "result0", True)
+            self._write_result(results_dir, "result1", False)
+
+            topic_scores, skip_patterns, aggregate = scan_project(Path(tmpdir))
+
+            assert topic_scores["system_design"] == {"correct": 1, "total": 2}
+            assert aggregate["total_quizzes"] == 2
+            assert aggregate["overall_score"] == 50
+
+    def test_cache_file_is_written_and_not_treated_as_result(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results_dir = Path(tmpdir) / ".claude" / "quiz-results"
+            results_dir.mkdir(parents=True)
+            self._write_result(results_dir, "result0", True)
+
+            first = scan_project(Path(tmpdir))
+            assert (results_dir / ".cache.json").exists()
+
+            # Second scan served from cache, and the cache file itself
+            # must not be counted as a quiz result
+            second = scan_project(Path(tmpdir))
+            assert second == first
+            assert second[2]["total_quizzes"] == 1
+            assert len(load_all_results(Path(tmpdir))) == 1
+
+    def test_picks_up_new_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results_dir = Path(tmpdir) / ".claude" / "quiz-results"
+            results_dir.mkdir(parents=True)
+            self._write_result(results_dir, "result0", True)
+            scan_project(Path(tmpdir))
+
+            self._write_result(results_dir, "result1", False)
+            _, _, aggregate = scan_project(Path(tmpdir))
+            assert aggregate["total_quizzes"] == 2
+            assert aggregate["total_correct"] == 1
+
+
 class TestCalculateTopicScores:
     """Tests for calculating scores by topic."""
 
@@ -14,6 +14,8 @@ from scheduler import (
     ScheduleType,
     get_due_quizzes,
     load_quiz_state,
+    record_pending_quiz,
+    record_quiz_completed,
     save_quiz_state,
     schedule_quiz,
     should_schedule_quiz,
@@ -50,6 +52,33 @@ class TestLoadQuizState:
             assert "completed_quizzes" in result
             assert result["sessions"] == []
 
+    def test_cached_load_returns_private_copy(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / ".claude" / "quiz-state.json"
+            state_file.parent.mkdir(parents=True)
+            with open(state_file, "w") as f:
+                json.dump({"project": "test", "sessions": [],
+                           "pending_quizzes": [], "completed_quizzes": []}, f)
+
+            first = load_quiz_state(Path(tmpdir))
+            first["pending_quizzes"].append({"session_id": "mutated"})
+
+            # A second load must not see the caller's mutation
+            second = load_quiz_state(Path(tmpdir))
+            assert second["pending_quizzes"] == []
+
+    def test_cache_sees_saved_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state = load_quiz_state(Path(tmpdir))
+            save_quiz_state(Path(tmpdir), state)
+            load_quiz_state(Path(tmpdir))  # Warm the cache
+
+            state["sessions"].append({"id": "abc123"})
+            save_quiz_state(Path(tmpdir), state)
+
+            reloaded = load_quiz_state(Path(tmpdir))
+            assert len(reloaded["sessions"]) == 1
+
 
 class TestSaveQuizState:
     """Tests for saving quiz state."""
@@ -72,6 +101,49 @@ class TestSaveQuizState:
             assert loaded["project"] == "test"
 
 
+class TestStateJournal:
+    """Tests for the append-only quiz-state journal."""
+
+    def _make_schedule(self, session_id):
+        return schedule_quiz(
+            session_id=session_id,
+            schedule_type=ScheduleType.ON_DEMAND,
+            summary_path="/tmp/summary.json",
+        )
+
+    def test_recorded_quiz_appears_on_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            record_pending_quiz(Path(tmpdir), self._make_schedule("abc123"))
+
+            state = load_quiz_state(Path(tmpdir))
+            assert len(state["pending_quizzes"]) == 1
+            assert state["pending_quizzes"][0]["session_id"] == "abc123"
+            assert (Path(tmpdir) / ".claude" / "quiz-state.log").exists()
+
+    def test_completion_moves_quiz_to_completed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            record_pending_quiz(Path(tmpdir), self._make_schedule("abc123"))
+            record_quiz_completed(Path(tmpdir), "abc123", {"score": 80, "total": 5})
+
+            state = load_quiz_state(Path(tmpdir))
+            assert state["pending_quizzes"] == []
+            assert len(state["completed_quizzes"]) == 1
+            assert state["completed_quizzes"][0]["result"]["score"] == 80
+
+    def test_save_folds_journal_into_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            record_pending_quiz(Path(tmpdir), self._make_schedule("abc123"))
+
+            state = load_quiz_state(Path(tmpdir))
+            save_quiz_state(Path(tmpdir), state)
+
+            log_file = Path(tmpdir) / ".claude" / "quiz-state.log"
+            assert not log_file.exists()
+            # No double-apply after compaction
+            reloaded = load_quiz_state(Path(tmpdir))
+            assert len(reloaded["pending_quizzes"]) == 1
+
+
 class TestShouldScheduleQuiz:
     """Tests for determining if a quiz should be scheduled."""
 
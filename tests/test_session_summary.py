@@ -40,6 +40,23 @@ class TestLoadSessionActivities:
             assert len(result) == 2
             assert result[0]["event_type"] == "file_write"
 
+    def test_loads_jsonl_session_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_file = Path(tmpdir) / "session.jsonl"
+            lines = [
+                {"session_id": "abc123", "started": "2026-01-30T10:00:00"},
+                {"event_type": "file_write", "file_path": "/a.py"},
+                {"event_type": "command", "command": "docker logs api"}
+            ]
+            with open(session_file, "w") as f:
+                for line in lines:
+                    f.write(json.dumps(line) + "\n")
+
+            result = load_session_activities(session_file)
+            # Header line is skipped, only events returned
+            assert len(result) == 2
+            assert result[0]["event_type"] == "file_write"
+
     def test_returns_empty_for_missing_file(self):
         result = load_session_activities(Path("/nonexistent/session.json"))
         assert result == []